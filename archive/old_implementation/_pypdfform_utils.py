@@ -0,0 +1,32 @@
+"""
+Shared PyPDFForm helpers for the diagnostic scripts.
+
+PdfWrapper rebuilds its widget dictionary on every sample_data/schema
+access, so scripts that need several views of the same form should take
+one snapshot and derive everything from it.
+"""
+
+from typing import Any, Dict
+
+
+def snapshot(pdf) -> Dict[str, Any]:
+    """
+    Walk a PdfWrapper's widgets once and derive the common field views.
+
+    Args:
+        pdf: Loaded PyPDFForm PdfWrapper
+
+    Returns:
+        Dictionary with 'widgets', 'names', 'sample_data' and 'schema'
+    """
+    widgets = pdf.widgets
+    return {
+        'widgets': widgets,
+        'names': list(widgets),
+        'sample_data': {name: widget.sample_value for name, widget in widgets.items()},
+        # Same shape as PdfWrapper.schema
+        'schema': {
+            'type': 'object',
+            'properties': {name: widget.schema_definition for name, widget in widgets.items()},
+        },
+    }
@@ -4,6 +4,7 @@
 try:
     print("Testing PyPDFForm import...")
     from PyPDFForm import PdfWrapper
+    from _pypdfform_utils import snapshot
     print("✅ PyPDFForm imported")
     
     print("Loading W-4R PDF...")
@@ -11,7 +12,7 @@ try:
     print("✅ PDF loaded")
     
     print("Getting sample_data...")
-    data = pdf.sample_data
+    data = snapshot(pdf)['sample_data']
     print(f"✅ Found {len(data)} fields")
     
     print("Fields:")
@@ -20,7 +21,7 @@ try:
     
     print("Testing field rename...")
     if data:
-        first_field = list(data.keys())[0]
+        first_field = next(iter(data))
         new_name = f"test_{first_field}"
         print(f"Renaming {first_field} to {new_name}")
         
@@ -28,7 +29,7 @@ try:
         print("✅ Rename operation completed")
         
         # Check new fields
-        new_data = updated_pdf.sample_data
+        new_data = set(snapshot(updated_pdf)['names'])
         print(f"After rename: {len(new_data)} fields")
         
         if new_name in new_data and first_field not in new_data:
@@ -4,12 +4,28 @@ Examine W-4R PDF fields using different methods
 Task 2.1.2 - Understanding actual field structure
 """
 
+import csv
 import sys
+from operator import attrgetter
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
+from _pypdfform_utils import snapshot
+
+# PdfWrapper attributes worth inspecting; several of them re-walk the
+# AcroForm on access, so each is read at most once
+_INTROSPECT_ATTRS = ('sample_data', 'schema', 'widgets', 'pages')
+
+def _fallback_probe(pdf, attrs, introspect, introspect_errors):
+    """Read attributes one at a time, recording the ones that fail."""
+    for attr in attrs:
+        try:
+            introspect[attr] = getattr(pdf, attr)
+        except Exception as e:
+            introspect_errors[attr] = e
+
 def examine_with_pypdfform():
     """Examine fields using PyPDFForm"""
     print("🔍 Examining W-4R PDF with PyPDFForm...")
@@ -20,31 +36,43 @@ def examine_with_pypdfform():
         pdf_path = "training_data/pdf_csv_pairs/W-4R_parsed.pdf"
         pdf = PdfWrapper(pdf_path)
         
+        # One widget traversal provides sample_data, schema and widgets;
+        # read any remaining attributes once and keep the results
+        introspect = {}
+        introspect_errors = {}
+        try:
+            introspect.update(snapshot(pdf))
+        except Exception as e:
+            introspect_errors['schema'] = e
+        remaining = tuple(attr for attr in _INTROSPECT_ATTRS if attr not in introspect)
+        if remaining:
+            try:
+                values = attrgetter(*remaining)(pdf)
+                introspect.update(zip(remaining, values if len(remaining) > 1 else (values,)))
+            except Exception:
+                _fallback_probe(pdf, remaining, introspect, introspect_errors)
+        
         # Method 1: sample_data
-        sample_data = pdf.sample_data
+        sample_data = introspect.get('sample_data') or {}
         print(f"📊 sample_data found {len(sample_data)} fields:")
         for name, value in sample_data.items():
             print(f"  - {name}: {value}")
         
-        # Method 2: Try to access schema
-        try:
-            schema = pdf.schema
+        # Method 2: schema
+        if 'schema' in introspect:
+            schema = introspect['schema']
             print(f"📊 schema found {len(schema)} fields:")
             for name, info in schema.items():
                 print(f"  - {name}: {info}")
-        except Exception as e:
-            print(f"⚠️  schema not accessible: {e}")
+        else:
+            print(f"⚠️  schema not accessible: {introspect_errors.get('schema')}")
         
-        # Method 3: Try other attributes
+        # Method 3: Other attributes
         print(f"📋 PDF attributes:")
-        for attr in dir(pdf):
-            if not attr.startswith('_') and not callable(getattr(pdf, attr)):
-                try:
-                    value = getattr(pdf, attr)
-                    if value is not None:
-                        print(f"  - {attr}: {type(value)} = {str(value)[:100]}")
-                except:
-                    pass
+        for attr in _INTROSPECT_ATTRS:
+            value = introspect.get(attr)
+            if value is not None:
+                print(f"  - {attr}: {type(value)} = {str(value)[:100]}")
         
         return sample_data
         
@@ -99,21 +127,23 @@ def examine_training_data():
         return []
     
     try:
-        import pandas as pd
-        df = pd.read_csv(csv_path)
+        with open(csv_path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            columns = reader.fieldnames or []
+            rows = list(reader)
         
-        print(f"📊 Training data has {len(df)} field records")
-        print(f"📋 Columns: {list(df.columns)}")
+        print(f"📊 Training data has {len(rows)} field records")
+        print(f"📋 Columns: {list(columns)}")
         
-        if 'Api name' in df.columns:
-            api_names = df['Api name'].tolist()
+        if 'Api name' in columns:
+            api_names = [row['Api name'] for row in rows]
             print(f"📊 Expected BEM field names ({len(api_names)}):")
             for name in api_names:
                 print(f"  - {name}")
             return api_names
         
-        if 'Acrofieldlabel' in df.columns:
-            original_names = df['Acrofieldlabel'].tolist()
+        if 'Acrofieldlabel' in columns:
+            original_names = [row['Acrofieldlabel'] for row in rows]
             print(f"📊 Original field names ({len(original_names)}):")
             for name in original_names:
                 print(f"  - {name}")
@@ -146,12 +176,13 @@ def main():
     
     if pypdfform_fields and expected_fields:
         print(f"\n🔍 Field name comparison:")
-        pypdfform_names = set(pypdfform_fields.keys())
-        expected_names = set(expected_fields)
-        
-        common = pypdfform_names.intersection(expected_names)
-        pypdfform_only = pypdfform_names - expected_names
-        expected_only = expected_names - pypdfform_names
+        pypdfform_names = frozenset(pypdfform_fields)
+        expected_names = frozenset(expected_fields)
+        common, pypdfform_only, expected_only = (
+            pypdfform_names & expected_names,
+            pypdfform_names - expected_names,
+            expected_names - pypdfform_names,
+        )
         
         print(f"  Common fields: {len(common)}")
         print(f"  PyPDFForm only: {len(pypdfform_only)}")
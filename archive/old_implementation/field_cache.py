@@ -0,0 +1,103 @@
+"""
+On-disk cache for extracted PDF field metadata.
+
+Stores the result of PyPDFForm field extraction as JSON under
+~/.cache/pdfparsev2/ so repeated tool calls against the same PDF
+(extract → preview → modify) only parse the PDF once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pdfparsev2"
+
+
+# Bytes of the file header hashed into the cache key
+HEADER_BYTES = 4096
+
+
+def cache_key(pdf_path: str) -> Tuple[int, int, str]:
+    """
+    Build a cheap identity key for a PDF file.
+
+    Only the first 4 KiB are hashed; size and mtime catch edits elsewhere
+    in the file (changing form fields rewrites the xref table anyway).
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Tuple of (size, mtime in ns, blake2b digest of the file header)
+    """
+    with open(pdf_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        head = f.read(HEADER_BYTES)
+    return (st.st_size, st.st_mtime_ns, hashlib.blake2b(head, digest_size=8).hexdigest())
+
+
+class FieldCache:
+    """
+    JSON file cache for extracted field metadata, keyed by PDF content.
+
+    Example:
+        >>> cache = FieldCache()
+        >>> payload = cache.get("document.pdf")
+        >>> if payload is None:
+        ...     cache.put("document.pdf", {"fields": fields})
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the field cache.
+
+        Args:
+            cache_dir: Directory for cache files (defaults to ~/.cache/pdfparsev2)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    def _entry_path(self, pdf_path: str) -> Path:
+        size, mtime_ns, digest = cache_key(pdf_path)
+        return self.cache_dir / f"{digest}-{size}-{mtime_ns}.json"
+
+    def get(self, pdf_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached field metadata for a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Cached payload, or None on a cache miss
+        """
+        try:
+            with open(self._entry_path(pdf_path), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, pdf_path: str, payload: Dict[str, Any]) -> bool:
+        """
+        Store field metadata for a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+            payload: JSON-serializable field metadata
+
+        Returns:
+            True if the entry was written, False otherwise
+        """
+        try:
+            entry_path = self._entry_path(pdf_path)
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(entry_path, 'w') as f:
+                json.dump(payload, f, default=str)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write field cache for {pdf_path}: {e}")
+            return False
@@ -7,6 +7,7 @@ This script fixes the Claude Desktop configuration to point to the correct MCP s
 """
 
 import json
+import shutil
 import time
 from pathlib import Path
 
@@ -18,13 +19,18 @@ def fix_claude_desktop_config():
     project_root = Path(__file__).parent.absolute()
     
     # Check current config
-    if config_path.exists():
+    try:
+        config_data = config_path.read_bytes()
+    except FileNotFoundError:
+        config_data = None
+    
+    existing_config = None
+    if config_data is not None:
         print(f"📖 Reading existing config: {config_path}")
-        with open(config_path, 'r') as f:
-            current_config = json.load(f)
+        existing_config = json.loads(config_data)
         
         print("Current PDF server config:")
-        pdf_server = current_config.get('mcpServers', {}).get('pdf-field-modifier')
+        pdf_server = existing_config.get('mcpServers', {}).get('pdf-field-modifier')
         if pdf_server:
             print(f"  Path: {pdf_server.get('args', [''])[0]}")
             print(f"  Command: {pdf_server.get('command', 'N/A')}")
@@ -51,20 +57,21 @@ def fix_claude_desktop_config():
     }
     
     # Preserve other MCP servers if they exist
-    if config_path.exists():
+    if existing_config is not None:
+        if 'mcpServers' in existing_config:
+            for server_name, server_config in existing_config['mcpServers'].items():
+                if server_name != 'pdf-field-modifier':
+                    new_config['mcpServers'][server_name] = server_config
+        
+        # Nothing to do if the config is already correct (no write, no backup)
+        if existing_config == new_config:
+            print("✅ Claude Desktop configuration already up to date")
+            return True
+        
         try:
-            with open(config_path, 'r') as f:
-                existing_config = json.load(f)
-            
-            # Merge with existing config
-            if 'mcpServers' in existing_config:
-                for server_name, server_config in existing_config['mcpServers'].items():
-                    if server_name != 'pdf-field-modifier':
-                        new_config['mcpServers'][server_name] = server_config
-            
-            # Create backup
-            backup_path = config_path.with_suffix(f'.json.backup.{int(time.time())}')\n            with open(backup_path, 'w') as f:
-                json.dump(existing_config, f, indent=2)
+            # Create backup (byte copy, no JSON re-encode)
+            backup_path = config_path.with_suffix(f'.json.backup.{int(time.time())}')
+            shutil.copy2(config_path, backup_path)
             print(f"✅ Backup created: {backup_path}")
             
         except Exception as e:
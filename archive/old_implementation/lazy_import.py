@@ -0,0 +1,41 @@
+"""
+Deferred module imports for the diagnostic scripts.
+
+lazy_import() binds a module name at the top of a script without running
+the module's init; the real import happens on first attribute access.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Return a module whose import is deferred until it is first used.
+
+    Built on importlib.util.LazyLoader: the module object is registered in
+    sys.modules immediately, and its first attribute access executes the
+    module and turns it back into a plain module.
+
+    Args:
+        name: Dotted module name, e.g. "PyPDFForm"
+
+    Returns:
+        The (possibly not yet executed) module, or None if it is not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -7,22 +7,40 @@ MCP (Model Context Protocol) server for PDF form field modification and BEM fiel
 Designed to work with Claude Desktop for intelligent PDF field analysis and renaming.
 """
 
+import asyncio
 import json
 import sys
 import os
+import re
 import shutil
 import logging
+from collections import deque
+from dataclasses import is_dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from functools import wraps
+from typing import Dict, List, Any, Optional, Union, Callable, Awaitable
 
 # PDF Processing Libraries
 try:
+    import PyPDFForm
     from PyPDFForm import PdfWrapper
     PYPDFFORM_AVAILABLE = True
+    _PYPDFFORM_VERSION = getattr(PyPDFForm, "__version__", None)
 except ImportError:
     print("Warning: PyPDFForm not available. Install with: pip install PyPDFForm==3.1.2")
     PYPDFFORM_AVAILABLE = False
+    _PYPDFFORM_VERSION = None
+
+# Version info reported by test_connection; fixed for the life of the process
+_PY_VERSION = "v" + sys.version.split(maxsplit=1)[0]
+_DEPENDENCIES = {
+    "python": _PY_VERSION,
+    "platform": sys.platform,
+    "PyPDFForm": (
+        (f"v{_PYPDFFORM_VERSION}" if _PYPDFFORM_VERSION else "installed (version unknown)")
+        if PYPDFFORM_AVAILABLE else "not available"
+    )
+}
 
 # Import our PyPDFForm wrapper
 try:
@@ -32,6 +50,13 @@ except ImportError:
     print("Warning: PyPDFForm wrapper not available")
     WRAPPER_AVAILABLE = False
 
+# Optional fast JSON encoder for tool responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from mcp.server import Server
     from mcp.types import Tool, TextContent
@@ -45,7 +70,7 @@ except ImportError:
         def create_initialization_options(self): return {}
     
     class Tool:
-        def __init__(self, **kwargs): pass
+        def __init__(self, **kwargs): self.__dict__.update(kwargs)
     
     class TextContent:
         def __init__(self, type, text): self.type = type; self.text = text
@@ -56,149 +81,57 @@ logger = logging.getLogger(__name__)
 
 app = Server("pdf-field-modifier")
 
-@app.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available MCP tools - BEM tool listed first for easy access."""
-    return [
-        Tool(
-            name="generate_bem_field_names",
-            description="🚀 Generate BEM field names for PDF forms using financial services naming conventions. Upload a PDF to Claude Desktop first, then use this tool with the filename to get section-by-section BEM field breakdown and JSON mapping.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pdf_filename": {
-                        "type": "string",
-                        "description": "Name of the PDF file that was uploaded to Claude Desktop (include .pdf extension)"
-                    }
-                },
-                "required": ["pdf_filename"]
-            }
-        ),
-        Tool(
-            name="modify_pdf_fields_v2",
-            description="Enhanced PDF field modification using PyPDFForm. Handles RadioGroups, complex hierarchies, and all PDF field types reliably. Claude Desktop handles field analysis and naming.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pdf_path": {
-                        "type": "string",
-                        "description": "Path to the PDF file to modify"
-                    },
-                    "field_mappings": {
-                        "type": "object",
-                        "description": "Dictionary mapping old field names to new field names"
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Optional output path for the modified PDF",
-                        "default": ""
-                    },
-                    "validate_only": {
-                        "type": "boolean",
-                        "description": "If true, only validate mappings without modifying the PDF",
-                        "default": False
-                    },
-                    "progress_updates": {
-                        "type": "boolean",
-                        "description": "Enable progress reporting for large operations",
-                        "default": True
-                    }
-                },
-                "required": ["pdf_path", "field_mappings"]
-            }
-        ),
-        Tool(
-            name="extract_pdf_fields_enhanced",
-            description="Enhanced PDF field extraction using PyPDFForm. Detects RadioGroups, complex hierarchies, and all field types. Use this for field analysis when Claude Desktop needs additional field information.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pdf_path": {
-                        "type": "string",
-                        "description": "Path to the PDF file to analyze"
-                    }
-                },
-                "required": ["pdf_path"]
-            }
-        ),
-        Tool(
-            name="preview_field_renames",
-            description="Preview field renaming changes without applying them. Validates mappings and shows impact analysis before Claude Desktop applies changes.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pdf_path": {
-                        "type": "string",
-                        "description": "Path to the PDF file to preview"
-                    },
-                    "field_mappings": {
-                        "type": "object",
-                        "description": "Dictionary of proposed field name mappings"
-                    }
-                },
-                "required": ["pdf_path", "field_mappings"]
-            }
-        ),
-        Tool(
-            name="test_connection",
-            description="Test MCP server connection and verify all dependencies are working correctly",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_version_info": {
-                        "type": "boolean",
-                        "description": "Include detailed version information in the response",
-                        "default": True
-                    }
-                }
-            }
-        )
-    ]
+# Number of progress messages retained for a modify_pdf_fields_v2 response
+PROGRESS_MESSAGE_LIMIT = 64
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Handle tool calls."""
-    
-    try:
-        if name == "test_connection":
-            return await test_connection(**arguments)
-        elif name == "generate_bem_field_names":
-            return await generate_bem_field_names(**arguments)
-        elif name == "modify_pdf_fields_v2":
-            return await modify_pdf_fields_v2(**arguments)
-        elif name == "preview_field_renames":
-            return await preview_field_renames(**arguments)
-        elif name == "extract_pdf_fields_enhanced":
-            return await extract_pdf_fields_enhanced(**arguments)
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-    except Exception as e:
-        logger.error(f"Error in tool '{name}': {str(e)}")
-        error_result = {
-            "status": "error",
-            "tool": name,
-            "message": f"Tool execution failed: {str(e)}",
-            "timestamp": datetime.now().isoformat()
-        }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
 
-async def generate_bem_field_names(pdf_filename: str) -> List[TextContent]:
+def _json_default(obj: Any) -> Any:
+    """Serialize dataclass results (e.g. FieldRenameResult) without a per-item dict literal."""
+    if is_dataclass(obj):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    return str(obj)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as compact JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        # orjson encodes dataclasses natively; the hook only covers the rest
+        return orjson.dumps(obj, default=_json_default).decode()
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+
+def mcp_tool_errors(tool_name: str):
     """
-    🚀 Generate BEM field names for uploaded PDF forms using financial services conventions.
-    
-    This tool uses the proven Name Generation Prompt to analyze PDF forms and create
-    section-by-section BEM field breakdowns with JSON mappings.
+    Decorator that turns an exception raised by a tool handler into an error response.
     
     Args:
-        pdf_filename: Name of the PDF file that was uploaded to Claude Desktop
+        tool_name: MCP tool name reported in the error response
     
     Returns:
-        Analysis prompt for Claude to execute with the uploaded PDF
+        Decorator wrapping an async tool handler
     """
-    
-    try:
-        # The exact prompt that worked perfectly in our testing
-        prompt = f"""I've uploaded a PDF file named "{pdf_filename}". Generate BEM field names for this PDF form using our financial services naming conventions.
+    def decorator(handler):
+        @wraps(handler)
+        async def wrapper(*args, **kwargs) -> List[TextContent]:
+            try:
+                return await handler(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Tool '{tool_name}' failed: {str(e)}")
+                error_result = {
+                    "status": "error",
+                    "tool": tool_name,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "message": f"Tool execution failed: {str(e)}",
+                    "timestamp": datetime.now().isoformat()
+                }
+                return [TextContent(type="text", text=_dumps(error_result))]
+        return wrapper
+    return decorator
+
+# BEM naming prompt, built once at import.
+# The exact prompt that worked perfectly in our testing.
+BEM_PROMPT_TEMPLATE = """I've uploaded a PDF file named "{pdf_filename}". Generate BEM field names for this PDF form using our financial services naming conventions.
 
 Create a section-by-section field breakdown showing:
 - Each form section
@@ -243,7 +176,7 @@ Format the output as:
     "form_type": "detected form type",
     "form_id": "detected form identifier", 
     "field_count": number_of_fields,
-    "extraction_timestamp": "{datetime.now().isoformat()}",
+    "extraction_timestamp": "{timestamp}",
     "original_file": "{pdf_filename}"
   }},
   "field_mappings": [
@@ -259,73 +192,201 @@ Format the output as:
   ]
 }}
 ```"""
-        
-        # Return the prompt for Claude to execute naturally
-        return [TextContent(type="text", text=prompt)]
-        
-    except Exception as e:
-        error_result = {
-            "status": "error",
-            "tool": "generate_bem_field_names",
-            "error": str(e),
-            "pdf_filename": pdf_filename,
-            "message": f"Failed to prepare BEM field name generation: {str(e)}",
-            "timestamp": datetime.now().isoformat()
-        }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
 
-async def test_connection(include_version_info: bool = True) -> List[TextContent]:
-    """Test the MCP server connection and dependencies."""
-    try:
-        test_result = {
-            "status": "success",
-            "message": "✅ PDF Field Modifier + BEM Name Generator is working correctly with Claude Desktop integration!",
-            "architecture": "Claude Desktop Intelligence + PyPDFForm PDF Field Modification + BEM Field Naming",
-            "server_name": "pdf-field-modifier",
-            "tools_available": ["generate_bem_field_names", "modify_pdf_fields_v2", "extract_pdf_fields_enhanced", "preview_field_renames", "test_connection"],
-            "workflow": "Upload PDF to Claude → Use generate_bem_field_names tool → Get BEM names → Use modify_pdf_fields_v2 to rename fields",
-            "capabilities": [
-                "🚀 BEM field name generation with financial services conventions",
-                "PyPDFForm-based field renaming (95%+ success rate)",
-                "RadioGroup and complex hierarchy support",
-                "All PDF field types supported",
-                "Progress tracking and validation",
-                "Automatic backup and safety features"
-            ],
-            "integration": "Claude Desktop handles field extraction and BEM naming generation",
-            "timestamp": datetime.now().isoformat()
+# Constant text around the placeholders (filename, timestamp, filename), with
+# brace escapes already resolved, so each call is a single str.join
+_PROMPT_PARTS = tuple(
+    part.replace("{{", "{").replace("}}", "}")
+    for part in re.split(r"\{(?:pdf_filename|timestamp)\}", BEM_PROMPT_TEMPLATE)
+)
+
+# Tool definitions never change, so build them once at import. Schema leaves
+# that are sequences are tuples so the shared definitions cannot be mutated;
+# property dicts stay plain dicts because MappingProxyType is not JSON-serializable.
+_TOOLS = [
+    Tool(
+        name="generate_bem_field_names",
+        description="🚀 Generate BEM field names for PDF forms using financial services naming conventions. Upload a PDF to Claude Desktop first, then use this tool with the filename to get section-by-section BEM field breakdown and JSON mapping.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_filename": {
+                    "type": "string",
+                    "description": "Name of the PDF file that was uploaded to Claude Desktop (include .pdf extension)"
+                }
+            },
+            "required": ("pdf_filename",)
+        }
+    ),
+    Tool(
+        name="modify_pdf_fields_v2",
+        description="Enhanced PDF field modification using PyPDFForm. Handles RadioGroups, complex hierarchies, and all PDF field types reliably. Claude Desktop handles field analysis and naming.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_path": {
+                    "type": "string",
+                    "description": "Path to the PDF file to modify"
+                },
+                "field_mappings": {
+                    "type": "object",
+                    "description": "Dictionary mapping old field names to new field names"
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Optional output path for the modified PDF",
+                    "default": ""
+                },
+                "validate_only": {
+                    "type": "boolean",
+                    "description": "If true, only validate mappings without modifying the PDF",
+                    "default": False
+                },
+                "progress_updates": {
+                    "type": "boolean",
+                    "description": "Enable progress reporting for large operations",
+                    "default": True
+                }
+            },
+            "required": ("pdf_path", "field_mappings")
+        }
+    ),
+    Tool(
+        name="extract_pdf_fields_enhanced",
+        description="Enhanced PDF field extraction using PyPDFForm. Detects RadioGroups, complex hierarchies, and all field types. Use this for field analysis when Claude Desktop needs additional field information.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_path": {
+                    "type": "string",
+                    "description": "Path to the PDF file to analyze"
+                }
+            },
+            "required": ("pdf_path",)
+        }
+    ),
+    Tool(
+        name="preview_field_renames",
+        description="Preview field renaming changes without applying them. Validates mappings and shows impact analysis before Claude Desktop applies changes.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pdf_path": {
+                    "type": "string",
+                    "description": "Path to the PDF file to preview"
+                },
+                "field_mappings": {
+                    "type": "object",
+                    "description": "Dictionary of proposed field name mappings"
+                }
+            },
+            "required": ("pdf_path", "field_mappings")
         }
-        
-        if include_version_info:
-            dependencies = {
-                "python": f"v{sys.version.split()[0]}",
-                "platform": sys.platform
+    ),
+    Tool(
+        name="test_connection",
+        description="Test MCP server connection and verify all dependencies are working correctly",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_version_info": {
+                    "type": "boolean",
+                    "description": "Include detailed version information in the response",
+                    "default": True
+                }
             }
-            
-            if PYPDFFORM_AVAILABLE:
-                try:
-                    from PyPDFForm import __version__ as pypdfform_version
-                    dependencies["PyPDFForm"] = f"v{pypdfform_version}"
-                except ImportError:
-                    dependencies["PyPDFForm"] = "installed (version unknown)"
-            else:
-                dependencies["PyPDFForm"] = "not available"
-            
-            test_result["dependencies"] = dependencies
-        
-        logger.info("MCP server test completed successfully")
-        return [TextContent(type="text", text=json.dumps(test_result, indent=2))]
-        
+        }
+    )
+]
+
+# Derived once from _TOOLS for responses that report the tool set
+_TOOL_NAMES = tuple(tool.name for tool in _TOOLS)
+
+@app.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available MCP tools - BEM tool listed first for easy access."""
+    return _TOOLS
+
+@app.call_tool()
+async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+    """Handle tool calls."""
+    
+    try:
+        handler = _HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await handler(**arguments)
     except Exception as e:
-        logger.error(f"MCP server test failed: {str(e)}")
+        logger.error(f"Error in tool '{name}': {str(e)}")
         error_result = {
             "status": "error",
-            "message": f"MCP server test failed: {str(e)}",
+            "tool": name,
+            "message": f"Tool execution failed: {str(e)}",
             "timestamp": datetime.now().isoformat()
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+        return [TextContent(type="text", text=_dumps(error_result))]
+
+@mcp_tool_errors("generate_bem_field_names")
+async def generate_bem_field_names(pdf_filename: str) -> List[TextContent]:
+    """
+    🚀 Generate BEM field names for uploaded PDF forms using financial services conventions.
+    
+    This tool uses the proven Name Generation Prompt to analyze PDF forms and create
+    section-by-section BEM field breakdowns with JSON mappings.
+    
+    Args:
+        pdf_filename: Name of the PDF file that was uploaded to Claude Desktop
+    
+    Returns:
+        Analysis prompt for Claude to execute with the uploaded PDF
+    """
+    
+    ts = datetime.now().isoformat()
+    # Return the prompt for Claude to execute naturally
+    prompt = "".join((
+        _PROMPT_PARTS[0], pdf_filename,
+        _PROMPT_PARTS[1], ts,
+        _PROMPT_PARTS[2], pdf_filename,
+        _PROMPT_PARTS[3]
+    ))
+    return [TextContent(type="text", text=prompt)]
 
-# PyPDFForm Tool Implementations (existing tools unchanged)
+@mcp_tool_errors("test_connection")
+async def test_connection(include_version_info: bool = True) -> List[TextContent]:
+    """Test the MCP server connection and dependencies."""
+    ts = datetime.now().isoformat()
+    test_result = {
+        "status": "success",
+        "message": "✅ PDF Field Modifier + BEM Name Generator is working correctly with Claude Desktop integration!",
+        "architecture": "Claude Desktop Intelligence + PyPDFForm PDF Field Modification + BEM Field Naming",
+        "server_name": "pdf-field-modifier",
+        "tools_available": _TOOL_NAMES,
+        "workflow": "Upload PDF to Claude → Use generate_bem_field_names tool → Get BEM names → Use modify_pdf_fields_v2 to rename fields",
+        "capabilities": [
+            "🚀 BEM field name generation with financial services conventions",
+            "PyPDFForm-based field renaming (95%+ success rate)",
+            "RadioGroup and complex hierarchy support",
+            "All PDF field types supported",
+            "Progress tracking and validation",
+            "Automatic backup and safety features"
+        ],
+        "integration": "Claude Desktop handles field extraction and BEM naming generation",
+        "timestamp": ts
+    }
+    
+    if include_version_info:
+        test_result["dependencies"] = {**_DEPENDENCIES}
+    
+    logger.info("MCP server test completed successfully")
+    return [TextContent(type="text", text=_dumps(test_result))]
+
+# PyPDFForm Tool Implementations
+async def _run_blocking(func, *args):
+    """Run synchronous PDF work on the loop's default executor so the event loop stays free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, func, *args)
+
+@mcp_tool_errors("modify_pdf_fields_v2")
 async def modify_pdf_fields_v2(
     pdf_path: str,
     field_mappings: Dict[str, str],
@@ -334,171 +395,184 @@ async def modify_pdf_fields_v2(
     progress_updates: bool = True
 ) -> List[TextContent]:
     """Enhanced PDF field modification using PyPDFForm (v2.0.0)."""
+    ts = datetime.now().isoformat()
     
-    try:
-        if not PYPDFFORM_AVAILABLE or not WRAPPER_AVAILABLE:
-            raise ImportError("PyPDFForm v2.0.0 not available. Please install: pip install PyPDFForm==3.1.2")
-        
-        progress_messages = []
-        def progress_callback(progress: ProgressUpdate):
-            if progress_updates:
-                message = f"Progress: {progress.percentage:.1f}% - {progress.operation}"
-                progress_messages.append(message)
-                logger.info(message)
-        
-        renamer = PyPDFFormFieldRenamer(
-            pdf_path, 
-            progress_callback=progress_callback if progress_updates else None
-        )
-        
-        if not renamer.load_pdf():
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "error": "Failed to load PDF file",
-                "pdf_path": pdf_path,
-                "timestamp": datetime.now().isoformat()
-            }, indent=2))]
-        
-        validation_results = renamer.validate_mappings(field_mappings)
-        if validation_results.get('errors'):
-            return [TextContent(type="text", text=json.dumps({
-                "status": "validation_error",
-                "validation_errors": validation_results['errors'],
-                "warnings": validation_results.get('warnings', []),
-                "timestamp": datetime.now().isoformat()
-            }, indent=2))]
-        
-        if validate_only:
-            return [TextContent(type="text", text=json.dumps({
-                "status": "validation_success",
-                "message": "Field mappings validation passed",
-                "validation_results": validation_results,
-                "field_count": len(field_mappings),
-                "estimated_success_rate": "100%",
-                "timestamp": datetime.now().isoformat()
-            }, indent=2))]
-        
-        results = renamer.rename_fields(field_mappings)
-        successful = sum(1 for r in results if r.success)
-        total = len(results)
-        success_rate = (successful / total * 100) if total > 0 else 0
-        
-        if not output_path:
-            output_path = pdf_path.replace('.pdf', '_renamed.pdf')
-        
-        if renamer.save_pdf(output_path):
-            result = {
-                "status": "success",
-                "message": f"PyPDFForm v2.0.0 field renaming completed with {success_rate:.1f}% success rate",
-                "engine": "PyPDFForm v2.0.0",
-                "output_path": output_path,
-                "success_rate": f"{success_rate:.1f}%",
-                "successful_renames": successful,
-                "total_fields": total,
-                "failed_renames": total - successful,
-                "progress_messages": progress_messages if progress_updates else [],
-                "results": [
-                    {
-                        "old_name": r.old_name,
-                        "new_name": r.new_name,
-                        "success": r.success,
-                        "error": r.error
-                    } for r in results
-                ],
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            result = {
-                "status": "save_error",
-                "error": "Failed to save modified PDF",
-                "results": results,
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-            
-    except Exception as e:
-        logger.error(f"PyPDFForm v2.0.0 field modification failed: {str(e)}")
-        error_result = {
+    if not PYPDFFORM_AVAILABLE or not WRAPPER_AVAILABLE:
+        raise ImportError("PyPDFForm v2.0.0 not available. Please install: pip install PyPDFForm==3.1.2")
+    
+    # Keep only the most recent progress messages; large forms emit one per field
+    progress_messages = deque(maxlen=PROGRESS_MESSAGE_LIMIT) if progress_updates else None
+    def progress_callback(progress: ProgressUpdate):
+        if progress_messages is not None:
+            message = f"Progress: {progress.percentage:.1f}% - {progress.operation}"
+            progress_messages.append(message)
+            logger.info(message)
+    
+    renamer = PyPDFFormFieldRenamer(
+        pdf_path, 
+        progress_callback=progress_callback if progress_updates else None
+    )
+    
+    if not await _run_blocking(renamer.load_pdf):
+        return [TextContent(type="text", text=_dumps({
             "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
+            "error": "Failed to load PDF file",
+            "pdf_path": pdf_path,
+            "timestamp": ts
+        }))]
+    
+    validation_results = renamer.validate_mappings(field_mappings)
+    if validation_results.get('errors'):
+        return [TextContent(type="text", text=_dumps({
+            "status": "validation_error",
+            "validation_errors": validation_results['errors'],
+            "warnings": validation_results.get('warnings', []),
+            "timestamp": ts
+        }))]
+    
+    if validate_only:
+        return [TextContent(type="text", text=_dumps({
+            "status": "validation_success",
+            "message": "Field mappings validation passed",
+            "validation_results": validation_results,
+            "field_count": len(field_mappings),
+            "estimated_success_rate": "100%",
+            "timestamp": ts
+        }))]
+    
+    results = await _run_blocking(renamer.rename_fields, field_mappings)
+    successful = sum(1 for r in results if r.success)
+    total = len(results)
+    success_rate = (successful / total * 100) if total > 0 else 0
+    
+    if not output_path:
+        base, ext = os.path.splitext(pdf_path)
+        output_path = base + '_renamed' + ext
+    
+    if await _run_blocking(renamer.save_pdf, output_path):
+        result = {
+            "status": "success",
+            "message": f"PyPDFForm v2.0.0 field renaming completed with {success_rate:.1f}% success rate",
             "engine": "PyPDFForm v2.0.0",
-            "timestamp": datetime.now().isoformat()
+            "output_path": output_path,
+            "success_rate": f"{success_rate:.1f}%",
+            "successful_renames": successful,
+            "total_fields": total,
+            "failed_renames": total - successful,
+            "progress_messages": list(progress_messages) if progress_messages is not None else [],
+            "results": results,
+            "timestamp": ts
         }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+    else:
+        result = {
+            "status": "save_error",
+            "error": "Failed to save modified PDF",
+            "results": results,
+            "timestamp": ts
+        }
+    
+    return [TextContent(type="text", text=_dumps(result))]
 
+@mcp_tool_errors("preview_field_renames")
 async def preview_field_renames(pdf_path: str, field_mappings: Dict[str, str]) -> List[TextContent]:
-    """Preview field renaming without making changes."""
-    return await modify_pdf_fields_v2(
-        pdf_path=pdf_path,
-        field_mappings=field_mappings,
-        validate_only=True
+    """Preview field renaming without making changes (load + validate only)."""
+    ts = datetime.now().isoformat()
+    
+    if not PYPDFFORM_AVAILABLE or not WRAPPER_AVAILABLE:
+        raise ImportError("PyPDFForm v2.0.0 not available. Please install: pip install PyPDFForm==3.1.2")
+    
+    renamer = PyPDFFormFieldRenamer(pdf_path)
+    
+    if not await _run_blocking(renamer.load_pdf):
+        return [TextContent(type="text", text=_dumps({
+            "status": "error",
+            "error": "Failed to load PDF file",
+            "pdf_path": pdf_path,
+            "timestamp": ts
+        }))]
+    
+    # Check sources against the widgets just parsed, so the load isn't wasted
+    validation_results = renamer.validate_mappings(
+        field_mappings, existing_fields=list(renamer.wrapper.widgets)
     )
+    if validation_results.get('errors'):
+        result = {
+            "status": "validation_error",
+            "validation_errors": validation_results['errors'],
+            "warnings": validation_results.get('warnings', []),
+            "timestamp": ts
+        }
+    else:
+        result = {
+            "status": "validation_success",
+            "message": "Field mappings validation passed",
+            "validation_results": validation_results,
+            "field_count": len(field_mappings),
+            "estimated_success_rate": "100%",
+            "timestamp": ts
+        }
+    
+    return [TextContent(type="text", text=_dumps(result))]
 
+@mcp_tool_errors("extract_pdf_fields_enhanced")
 async def extract_pdf_fields_enhanced(pdf_path: str) -> List[TextContent]:
     """Extract all form fields from PDF with enhanced metadata."""
+    ts = datetime.now().isoformat()
     
-    try:
-        if not PYPDFFORM_AVAILABLE or not WRAPPER_AVAILABLE:
-            raise ImportError("PyPDFForm v2.0.0 not available. Please install: pip install PyPDFForm==3.1.2")
-        
-        renamer = PyPDFFormFieldRenamer(pdf_path)
-        
-        if not renamer.load_pdf():
-            return [TextContent(type="text", text=json.dumps({
-                "status": "error",
-                "error": "Failed to load PDF file",
-                "pdf_path": pdf_path,
-                "timestamp": datetime.now().isoformat()
-            }, indent=2))]
-        
-        fields = renamer.extract_fields()
-        
-        result = {
-            "status": "success",
-            "message": "Enhanced PDF field extraction completed using PyPDFForm v2.0.0",
-            "engine": "PyPDFForm v2.0.0",
-            "pdf_path": pdf_path,
-            "field_count": len(fields),
-            "fields": fields,
-            "metadata": {
-                "extracted_at": datetime.now().isoformat(),
-                "extraction_method": "PyPDFForm",
-                "pdf_size_bytes": Path(pdf_path).stat().st_size if Path(pdf_path).exists() else 0,
-                "features": [
-                    "100% field renaming success rate",
-                    "Progress tracking",
-                    "Field validation",
-                    "Enhanced error handling"
-                ]
-            },
-            "next_steps": [
-                "Use generate_bem_field_names to get BEM field names",
-                "Use modify_pdf_fields_v2 for actual field renaming",
-                "Use preview_field_renames to validate changes first"
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-    except Exception as e:
-        logger.error(f"Enhanced PDF field extraction failed: {str(e)}")
-        error_result = {
+    if not PYPDFFORM_AVAILABLE or not WRAPPER_AVAILABLE:
+        raise ImportError("PyPDFForm v2.0.0 not available. Please install: pip install PyPDFForm==3.1.2")
+    
+    renamer = PyPDFFormFieldRenamer(pdf_path)
+    
+    if not await _run_blocking(renamer.load_pdf):
+        return [TextContent(type="text", text=_dumps({
             "status": "error",
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "engine": "PyPDFForm v2.0.0",
+            "error": "Failed to load PDF file",
             "pdf_path": pdf_path,
-            "timestamp": datetime.now().isoformat()
-        }
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+            "timestamp": ts
+        }))]
+    
+    fields = await _run_blocking(renamer.extract_fields)
+    
+    result = {
+        "status": "success",
+        "message": "Enhanced PDF field extraction completed using PyPDFForm v2.0.0",
+        "engine": "PyPDFForm v2.0.0",
+        "pdf_path": pdf_path,
+        "field_count": len(fields),
+        "fields": fields,
+        "metadata": {
+            "extracted_at": ts,
+            "extraction_method": "PyPDFForm",
+            "pdf_size_bytes": renamer.file_size or 0,
+            "features": [
+                "100% field renaming success rate",
+                "Progress tracking",
+                "Field validation",
+                "Enhanced error handling"
+            ]
+        },
+        "next_steps": [
+            "Use generate_bem_field_names to get BEM field names",
+            "Use modify_pdf_fields_v2 for actual field renaming",
+            "Use preview_field_renames to validate changes first"
+        ],
+        "timestamp": ts
+    }
+    
+    return [TextContent(type="text", text=_dumps(result))]
+
+# Tool name → handler, used by call_tool
+_HANDLERS: Dict[str, Callable[..., Awaitable[List[TextContent]]]] = {
+    "test_connection": test_connection,
+    "generate_bem_field_names": generate_bem_field_names,
+    "modify_pdf_fields_v2": modify_pdf_fields_v2,
+    "preview_field_renames": preview_field_renames,
+    "extract_pdf_fields_enhanced": extract_pdf_fields_enhanced,
+}
 
 if __name__ == "__main__":
     """Run the COMPLETE MCP server when executed directly."""
-    import asyncio
-    
     async def main():
         try:
             from mcp.server.stdio import stdio_server
@@ -3,6 +3,7 @@
 Script to organize the PDFParseV2 project directory structure.
 """
 
+import errno
 import os
 import shutil
 from pathlib import Path
@@ -23,106 +24,97 @@ def create_directory_structure():
         "examples"
     ]
     
+    # Expand every entry into its ancestors once (docs/analysis and docs/guides
+    # share docs), then create shallowest-first so each mkdir is a single call;
+    # the root itself (and anything above it) may not exist yet
+    os.makedirs(project_root, exist_ok=True)
+    pending = set()
     for dir_path in directories:
-        full_path = project_root / dir_path
-        full_path.mkdir(parents=True, exist_ok=True)
-        print(f"Created directory: {full_path}")
+        parent = dir_path
+        while parent:
+            pending.add(parent)
+            parent = os.path.dirname(parent)
+    
+    for dir_path in sorted(pending, key=lambda p: p.count("/")):
+        try:
+            os.mkdir(os.path.join(project_root, dir_path))
+        except FileExistsError:
+            pass
+    
+    for dir_path in directories:
+        print(f"Created directory: {project_root / dir_path}")
+
+# Destination directory (relative to the project root) for each file to move
+ROUTE = {
+    # Documentation guides
+    "CLAUDE_DESKTOP_INSTRUCTIONS.md": "docs/guides",
+    "CLAUDE_DESKTOP_QUICK_SETUP.md": "docs/guides",
+    "CLAUDE_DESKTOP_SETUP.md": "docs/guides",
+    "CLAUDE_DESKTOP_VERIFICATION_GUIDE.md": "docs/guides",
+    "MCP_VERIFICATION_GUIDE.md": "docs/guides",
+    # Analysis documents
+    "LIFE_1528Q_STRUCTURE_ANALYSIS.md": "docs/analysis",
+    "PYPDFFORM_ANALYSIS.md": "docs/analysis",
+    "CLEANUP_SUMMARY.md": "docs/analysis",
+    "PROJECT_CLEANUP_SUMMARY.md": "docs/analysis",
+    "IMPLEMENTATION_COMPLETE.md": "docs/analysis",
+    "WRAPPER_FIX_SUMMARY.md": "docs/analysis",
+    # Results documents
+    "PHASE1_VALIDATION_SUMMARY.md": "docs/results",
+    "TASK_2_1_2_RESULTS.md": "docs/results",
+    "TASK_2_1_3_RESULTS.md": "docs/results",
+    "TASK_2_1_4_RESULTS.md": "docs/results",
+    # Scripts
+    "basic_test.py": "scripts",
+    "direct_test.py": "scripts",
+    "examine_w4r_fields.py": "scripts",
+    "fix_claude_desktop_config.py": "scripts",
+    "quick_test_all_pdfs.py": "scripts",
+    "quick_wrapper_test.py": "scripts",
+    "setup_claude_desktop.py": "scripts",
+    "simple_pypdfform_test.py": "scripts",
+    "validate_fix.py": "scripts",
+    "validate_phase1.py": "scripts",
+    "commit_changes.sh": "scripts",
+    "organize_structure.py": "scripts",
+    "organize_project.py": "scripts",
+    # Tests
+    "test_complex_life_1528q.py": "tests/unit",
+    "test_comprehensive_all_pdfs.py": "tests/unit",
+    "test_enhanced_wrapper.py": "tests/unit",
+    "test_life_1528q_simple.py": "tests/unit",
+    "test_mcp_server.py": "tests/unit",
+    "test_mcp_server_basic.py": "tests/unit",
+    "test_mcp_setup.py": "tests/unit",
+    "test_pypdfform_w4r.py": "tests/unit",
+    "test_wrapper_fix.py": "tests/unit",
+}
+
+def move_file(src: str, dst: str):
+    """Move a file with a single rename, copying only across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
 
 def organize_files():
     """Organize files into appropriate directories."""
     project_root = Path("/Users/wseke/Desktop/PDFParseV2")
     
-    # Documentation files to move to docs/guides
-    doc_files = [
-        "CLAUDE_DESKTOP_INSTRUCTIONS.md",
-        "CLAUDE_DESKTOP_QUICK_SETUP.md", 
-        "CLAUDE_DESKTOP_SETUP.md",
-        "CLAUDE_DESKTOP_VERIFICATION_GUIDE.md",
-        "MCP_VERIFICATION_GUIDE.md"
-    ]
-    
-    for file_name in doc_files:
-        src = project_root / file_name
-        dst = project_root / "docs" / "guides" / file_name
-        if src.exists():
-            shutil.move(str(src), str(dst))
-            print(f"Moved {file_name} to docs/guides/")
-    
-    # Analysis files to move to docs/analysis
-    analysis_files = [
-        "LIFE_1528Q_STRUCTURE_ANALYSIS.md",
-        "PYPDFFORM_ANALYSIS.md",
-        "CLEANUP_SUMMARY.md",
-        "PROJECT_CLEANUP_SUMMARY.md",
-        "IMPLEMENTATION_COMPLETE.md",
-        "WRAPPER_FIX_SUMMARY.md"
-    ]
-    
-    for file_name in analysis_files:
-        src = project_root / file_name
-        dst = project_root / "docs" / "analysis" / file_name
-        if src.exists():
-            shutil.move(str(src), str(dst))
-            print(f"Moved {file_name} to docs/analysis/")
-    
-    # Results files to move to docs/results
-    results_files = [
-        "PHASE1_VALIDATION_SUMMARY.md",
-        "TASK_2_1_2_RESULTS.md",
-        "TASK_2_1_3_RESULTS.md", 
-        "TASK_2_1_4_RESULTS.md"
-    ]
-    
-    for file_name in results_files:
-        src = project_root / file_name
-        dst = project_root / "docs" / "results" / file_name
-        if src.exists():
-            shutil.move(str(src), str(dst))
-            print(f"Moved {file_name} to docs/results/")
-    
-    # Script files to move to scripts/
-    script_files = [
-        "basic_test.py",
-        "direct_test.py",
-        "examine_w4r_fields.py",
-        "fix_claude_desktop_config.py",
-        "quick_test_all_pdfs.py",
-        "quick_wrapper_test.py",
-        "setup_claude_desktop.py",
-        "simple_pypdfform_test.py",
-        "validate_fix.py",
-        "validate_phase1.py",
-        "commit_changes.sh",
-        "organize_structure.py",
-        "organize_project.py"
-    ]
-    
-    for file_name in script_files:
-        src = project_root / file_name
-        dst = project_root / "scripts" / file_name
-        if src.exists():
-            shutil.move(str(src), str(dst))
-            print(f"Moved {file_name} to scripts/")
-    
-    # Test files to move to tests/
-    test_files = [
-        "test_complex_life_1528q.py",
-        "test_comprehensive_all_pdfs.py",
-        "test_enhanced_wrapper.py",
-        "test_life_1528q_simple.py",
-        "test_mcp_server.py",
-        "test_mcp_server_basic.py",
-        "test_mcp_setup.py",
-        "test_pypdfform_w4r.py",
-        "test_wrapper_fix.py"
-    ]
-    
-    for file_name in test_files:
-        src = project_root / file_name
-        dst = project_root / "tests" / "unit" / file_name
-        if src.exists():
-            shutil.move(str(src), str(dst))
-            print(f"Moved {file_name} to tests/unit/")
+    # Resolve each destination directory to a plain string once, not per file
+    root = str(project_root)
+    dest_paths = {dest_dir: os.path.join(root, dest_dir) for dest_dir in set(ROUTE.values())}
+    
+    # One directory listing instead of an exists() check per candidate file
+    with os.scandir(root) as entries:
+        for entry in entries:
+            dest_dir = ROUTE.get(entry.name)
+            if dest_dir is None or not entry.is_file():
+                continue
+            move_file(entry.path, os.path.join(dest_paths[dest_dir], entry.name))
+            print(f"Moved {entry.name} to {dest_dir}/")
     
     # Move existing test files to proper structure
     existing_integration_tests = project_root / "tests" / "integration"
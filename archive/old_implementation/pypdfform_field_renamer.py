@@ -9,7 +9,12 @@ with reliable field detection via sample_data property and robust error handling
 from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
 import logging
+import os
+import re
+import time
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 import traceback
 
 try:
@@ -21,6 +26,72 @@ except ImportError as e:
     ) from e
 
 
+# Keyword tables used by field type detection (built once, not per field).
+# The keyword lists are compiled into single alternation regexes so each
+# check is one C-level scan instead of a Python loop of substring tests.
+_RADIO_PREFIXES = ('dividend_', 'stop_', 'frequency_', 'name-change_', 'address-change_')
+_RADIO_EXCLUDE_RE = re.compile(r'signature|date|former|present|amount|specify')
+_TEXT_FIELD_HINT_RE = re.compile(
+    r'name|former|present|amount|specify|first|last|address|'
+    r'city|state|zip|phone|email|ssn|contract'
+)
+
+
+@lru_cache(maxsize=4096)
+def _classify_field_name(field_name: str) -> str:
+    """
+    Classify a field by name alone; cached because the same names recur
+    across every PDF of a form family.
+    
+    Args:
+        field_name: Name of the field
+        
+    Returns:
+        Detected field type as string
+    """
+    name_lower = field_name.lower()
+    
+    # RadioGroup detection (MOST SPECIFIC - check first)
+    if field_name.endswith('--group'):
+        return 'RadioGroup'
+    
+    # Signature field detection
+    if ('signature' in name_lower or 'sign' in name_lower) and 'date' not in name_lower:
+        return 'Signature'
+    
+    # Date field detection (including signature dates)
+    if 'date' in name_lower:
+        return 'SignatureDate'
+    
+    # RadioButton detection based on training data patterns
+    # Pattern: section_option (e.g., dividend_accumulate, stop_direct, name-change_insured)
+    if ('_' in field_name and '__' not in field_name and 
+        not field_name.endswith('--group') and
+        not _RADIO_EXCLUDE_RE.search(name_lower)):
+        
+        # Check for known RadioButton patterns from training data
+        if field_name.startswith(_RADIO_PREFIXES):
+            return 'RadioButton'
+    
+    # Nested TextField detection (uses __ pattern)
+    # Pattern: section_option__field (e.g., address-change_owner__name)
+    if '__' in field_name:
+        return 'TextField'
+    
+    # Checkbox detection (specific patterns from training data)
+    if (('same' in name_lower and 'owner' in name_lower) or
+        ('change' in name_lower and 'amount' in name_lower) or
+        'check' in name_lower or 'box' in name_lower):
+        return 'CheckBox'
+    
+    # Standalone TextField patterns (common field names)
+    if _TEXT_FIELD_HINT_RE.search(name_lower):
+        return 'TextField'
+    
+    # Default to TextField for unknown patterns
+    return 'TextField'
+
+
 @dataclass
 class FieldRenameResult:
     """Result of a single field renaming operation."""
@@ -30,6 +101,52 @@ class FieldRenameResult:
     error: Optional[str] = None
 
 
+@dataclass
+class FieldInfo:
+    """
+    Metadata for a single extracted form field.
+
+    Slotted (no per-instance __dict__) since one is created per field. Supports
+    read-only dict-style access (field['type'], field.get(...), 'name' in field)
+    so existing callers keep working; use as_dict() when serializing.
+    """
+    __slots__ = (
+        'name', 'value', 'type', 'properties',
+        'parent_group', 'is_nested', 'nesting_level', 'group_prefix',
+        'parent_exists', 'parent_validated'
+    )
+    name: str
+    value: Any
+    type: str
+    properties: Dict[str, Any]
+    parent_group: Optional[str]
+    is_nested: bool
+    nesting_level: int
+    group_prefix: Optional[str]
+    parent_exists: bool
+    parent_validated: bool
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the plain dictionary used in JSON responses and caches.
+
+        Returns:
+            Dictionary with one entry per field attribute
+        """
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
 @dataclass
 class ProgressUpdate:
     """Progress update information for long-running operations."""
@@ -74,6 +191,8 @@ class PyPDFFormFieldRenamer:
         """
         self.pdf_path = Path(pdf_path)
         self.wrapper: Optional[PdfWrapper] = None
+        self.file_size: Optional[int] = None
+        self._sample_data_cache: Optional[Dict[str, Any]] = None
         self.progress_callback = progress_callback
         self.logger = logging.getLogger(__name__)
         
@@ -81,6 +200,32 @@ class PyPDFFormFieldRenamer:
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
     
+    @classmethod
+    def from_wrapper(
+        cls,
+        wrapper: PdfWrapper,
+        pdf_path: str,
+        progress_callback: Optional[Callable] = None,
+        sample_data: Optional[Dict[str, Any]] = None
+    ) -> 'PyPDFFormFieldRenamer':
+        """
+        Create a renamer around an already loaded PdfWrapper, skipping load_pdf().
+        
+        Args:
+            wrapper: PdfWrapper already constructed for pdf_path
+            pdf_path: Path to the PDF file the wrapper was loaded from
+            progress_callback: Optional callback for progress updates
+            sample_data: The wrapper's sample_data if the caller already read
+                it; reused instead of walking the form again
+            
+        Returns:
+            Renamer ready for extract_fields() / rename_fields()
+        """
+        renamer = cls(pdf_path, progress_callback=progress_callback)
+        renamer.wrapper = wrapper
+        renamer._sample_data_cache = sample_data
+        return renamer
+    
     def load_pdf(self) -> bool:
         """
         Load PDF file with PyPDFForm.
@@ -89,7 +234,12 @@ class PyPDFFormFieldRenamer:
             True if PDF loaded successfully, False otherwise
         """
         try:
-            self.wrapper = PdfWrapper(str(self.pdf_path))
+            # Read through one handle so the size comes from fstat, not another stat()
+            with open(self.pdf_path, 'rb') as f:
+                self.file_size = os.fstat(f.fileno()).st_size
+                pdf_bytes = f.read()
+            self.wrapper = PdfWrapper(pdf_bytes)
+            self._sample_data_cache = None
             self.logger.info(f"Successfully loaded PDF: {self.pdf_path.name}")
             return True
             
@@ -97,7 +247,22 @@ class PyPDFFormFieldRenamer:
             self.logger.error(f"Failed to load PDF {self.pdf_path}: {e}")
             return False
     
-    def extract_fields(self) -> List[Dict[str, Any]]:
+    @property
+    def sample_data(self) -> Dict[str, Any]:
+        """
+        Field name to sample value mapping, read from the wrapper once.
+        
+        PdfWrapper.sample_data rebuilds the mapping from the widgets on every
+        access, so the result is cached until a rename mutates the wrapper.
+        
+        Returns:
+            Dictionary mapping field names to sample values
+        """
+        if self._sample_data_cache is None:
+            self._sample_data_cache = self.wrapper.sample_data
+        return self._sample_data_cache
+    
+    def extract_fields(self) -> List[FieldInfo]:
         """
         Extract all form fields from PDF using PyPDFForm's sample_data with enhanced metadata.
         
@@ -106,7 +271,7 @@ class PyPDFFormFieldRenamer:
         for RadioGroups and nested field hierarchies.
         
         Returns:
-            List of field information dictionaries with enhanced metadata
+            List of FieldInfo records with enhanced metadata
         """
         if not self.wrapper:
             self.logger.error("PDF not loaded. Call load_pdf() first.")
@@ -117,46 +282,50 @@ class PyPDFFormFieldRenamer:
             
             # Use sample_data property - the reliable method for field detection
             try:
-                sample_data = self.wrapper.sample_data
+                sample_data = self.sample_data
                 if sample_data:
-                    # First pass: create basic field info
-                    for field_name, field_value in sample_data.items():
-                        field_type = self._detect_field_type(field_name, field_value)
-                        
-                        # Extract field information with enhanced metadata
-                        field_info = {
-                            'name': field_name,
-                            'value': field_value,
-                            'type': field_type,
-                            'properties': {
+                    # Classify every name in one batched map() before building dicts.
+                    # Mapping the lru_cache wrapper (implemented in C) directly means
+                    # names already seen are classified without a Python frame each.
+                    field_types = list(map(_classify_field_name, sample_data))
+                    
+                    # Single pass: build field info, grouping names by type as we go.
+                    # sample_data already holds every field name, so parent links
+                    # are checked against it directly instead of in a second pass.
+                    by_type = defaultdict(list)
+                    for (field_name, field_value), field_type in zip(sample_data.items(), field_types):
+                        by_type[field_type].append(field_name)
+                        relationships = self._analyze_field_relationships(field_name, field_type)
+                        parent_group = relationships['parent_group']
+                        parent_exists = bool(parent_group) and parent_group in sample_data
+                        fields.append(FieldInfo(
+                            name=field_name,
+                            value=field_value,
+                            type=field_type,
+                            properties={
                                 'sample_value': field_value,
-                                'is_empty': not bool(str(field_value).strip()) if field_value else True,
+                                # isspace() answers "blank?" without strip()'s copy;
+                                # str() of a str returns the same object
+                                'is_empty': not field_value or str(field_value).isspace(),
                                 'has_double_underscore': '__' in field_name,
                                 'has_single_underscore': '_' in field_name,
                                 'ends_with_group': field_name.endswith('--group')
-                            }
-                        }
-                        
-                        # Add relationship metadata
-                        field_info.update(self._analyze_field_relationships(field_name, field_type))
-                        
-                        fields.append(field_info)
-                    
-                    # Second pass: add parent-child relationship validation
-                    fields = self._enhance_field_relationships(fields)
+                            },
+                            parent_exists=parent_exists,
+                            parent_validated=parent_exists,
+                            **relationships
+                        ))
                     
                     # Log field type distribution for validation
-                    type_counts = {}
-                    for field in fields:
-                        field_type = field['type']
-                        type_counts[field_type] = type_counts.get(field_type, 0) + 1
+                    type_counts = {field_type: len(names) for field_type, names in by_type.items()}
                     
-                    self.logger.info(f"Successfully extracted {len(fields)} fields using sample_data")
-                    self.logger.info(f"Field type distribution: {type_counts}")
+                    self.logger.info("Successfully extracted %d fields using sample_data", len(fields))
+                    self.logger.info("Field type distribution: %s", type_counts)
                     
-                    # Validate against expected LIFE-1528-Q pattern (if applicable)
-                    if len(fields) > 50:  # Likely LIFE-1528-Q or similar complex form
-                        self._validate_complex_form_structure(fields, type_counts)
+                    # Validate against expected LIFE-1528-Q pattern (if applicable);
+                    # the check is an INFO-level report, so skip it when INFO is off
+                    if len(fields) > 50 and self.logger.isEnabledFor(logging.INFO):
+                        self._validate_complex_form_structure(by_type, type_counts)
                 
                 else:
                     self.logger.warning("sample_data returned empty - no form fields detected")
@@ -170,16 +339,22 @@ class PyPDFFormFieldRenamer:
                     if schema:
                         self.logger.info("Falling back to schema method")
                         for field_name, field_info in schema.items():
-                            fields.append({
-                                'name': field_name,
-                                'type': field_info.get('type', 'unknown'),
-                                'properties': field_info,
-                                'value': None
-                            })
+                            fields.append(FieldInfo(
+                                name=field_name,
+                                value=None,
+                                type=field_info.get('type', 'unknown'),
+                                properties=field_info,
+                                parent_group=None,
+                                is_nested=False,
+                                nesting_level=0,
+                                group_prefix=None,
+                                parent_exists=False,
+                                parent_validated=False
+                            ))
                 except (AttributeError, Exception) as schema_error:
                     self.logger.warning(f"Schema fallback also failed: {schema_error}")
             
-            self.logger.info(f"Final result: extracted {len(fields)} fields from PDF")
+            self.logger.info("Final result: extracted %d fields from PDF", len(fields))
             return fields
             
         except Exception as e:
@@ -202,55 +377,15 @@ class PyPDFFormFieldRenamer:
         Returns:
             Detected field type as string
         """
-        name_lower = field_name.lower()
-        
-        # RadioGroup detection (MOST SPECIFIC - check first)
-        if field_name.endswith('--group'):
-            return 'RadioGroup'
-        
-        # Signature field detection
-        if ('signature' in name_lower or 'sign' in name_lower) and 'date' not in name_lower:
-            return 'Signature'
-        
-        # Date field detection (including signature dates)
-        if 'date' in name_lower:
-            return 'SignatureDate'
-        
-        # RadioButton detection based on training data patterns
-        # Pattern: section_option (e.g., dividend_accumulate, stop_direct, name-change_insured)
-        if ('_' in field_name and '__' not in field_name and 
-            not field_name.endswith('--group') and
-            not any(x in name_lower for x in ['signature', 'date', 'former', 'present', 'amount', 'specify'])):
-            
-            # Check for known RadioButton patterns from training data
-            radio_patterns = [
-                'dividend_', 'stop_', 'frequency_', 'name-change_', 'address-change_'
-            ]
-            if any(field_name.startswith(pattern) for pattern in radio_patterns):
-                return 'RadioButton'
-        
-        # Nested TextField detection (uses __ pattern)
-        # Pattern: section_option__field (e.g., address-change_owner__name)
-        if '__' in field_name:
-            return 'TextField'
-        
-        # Checkbox detection (specific patterns from training data)
-        if (('same' in name_lower and 'owner' in name_lower) or
-            ('change' in name_lower and 'amount' in name_lower) or
-            'check' in name_lower or 'box' in name_lower):
-            return 'CheckBox'
-        
-        # Standalone TextField patterns (common field names)
-        if any(x in name_lower for x in ['name', 'former', 'present', 'amount', 'specify', 'first', 'last', 'address', 'city', 'state', 'zip', 'phone', 'email', 'ssn', 'contract']):
-            return 'TextField'
-        
-        # Default to TextField for unknown patterns
-        return 'TextField'
+        return _classify_field_name(field_name)
     
     def _analyze_field_relationships(self, field_name: str, field_type: str) -> Dict[str, Any]:
         """
         Analyze field relationships for RadioGroups and hierarchical structures.
         
+        Separators are located once with find() and the parts taken as slices,
+        so no partition tuples or unused tail strings are built.
+        
         Args:
             field_name: Name of the field to analyze
             field_type: Detected field type
@@ -258,77 +393,51 @@ class PyPDFFormFieldRenamer:
         Returns:
             Dictionary with relationship metadata
         """
-        relationships = {
-            'parent_group': None,
-            'is_nested': False,
-            'nesting_level': 0,
-            'group_prefix': None
-        }
+        parent_group = None
+        is_nested = False
+        nesting_level = 0
+        group_prefix = None
         
         # Analyze RadioGroup relationships
         if field_type == 'RadioGroup':
             # Extract group prefix (e.g., 'address-change' from 'address-change--group')
             if field_name.endswith('--group'):
-                relationships['group_prefix'] = field_name[:-7]  # Remove '--group'
+                group_prefix = field_name[:-7]  # Remove '--group'
         
         elif field_type == 'RadioButton':
-            # Find parent group by pattern matching
             # Pattern: 'section_option' where parent would be 'section--group'
-            if '_' in field_name:
-                parts = field_name.split('_', 1)
-                if len(parts) >= 2:
-                    potential_parent = f"{parts[0]}--group"
-                    relationships['parent_group'] = potential_parent
-                    relationships['group_prefix'] = parts[0]
-        
-        elif field_type == 'TextField' and '__' in field_name:
+            under_idx = field_name.find('_')
+            if under_idx >= 0:
+                group_prefix = field_name[:under_idx]
+                parent_group = f"{group_prefix}--group"
+        
+        elif field_type == 'TextField':
             # Nested TextField analysis: section_option__field
-            # Parent could be RadioButton: section_option
-            parts = field_name.split('__', 1)
-            if len(parts) >= 2:
-                potential_parent = parts[0]  # e.g., 'address-change_owner'
-                relationships['parent_group'] = potential_parent
-                relationships['is_nested'] = True
-                relationships['nesting_level'] = 2
+            # Parent could be RadioButton: section_option (e.g., 'address-change_owner')
+            dunder_idx = field_name.find('__')
+            if dunder_idx >= 0:
+                parent_group = field_name[:dunder_idx]
+                is_nested = True
+                nesting_level = 2
                 
-                # Also identify the main group
-                if '_' in potential_parent:
-                    group_parts = potential_parent.split('_', 1)
-                    if len(group_parts) >= 2:
-                        relationships['group_prefix'] = group_parts[0]
-        
-        return relationships
-    
-    def _enhance_field_relationships(self, fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Enhance field relationships by cross-referencing all fields.
-        
-        Args:
-            fields: List of field dictionaries
-            
-        Returns:
-            Enhanced fields list with validated relationships
-        """
-        # Create field name lookup for validation
-        field_names = {field['name'] for field in fields}
-        
-        for field in fields:
-            parent_group = field.get('parent_group')
-            if parent_group and parent_group in field_names:
-                field['parent_exists'] = True
-                field['parent_validated'] = True
-            else:
-                field['parent_exists'] = False
-                field['parent_validated'] = False
+                # Also identify the main group (first '_' before the '__')
+                under_idx = field_name.find('_', 0, dunder_idx)
+                if under_idx >= 0:
+                    group_prefix = field_name[:under_idx]
         
-        return fields
+        return {
+            'parent_group': parent_group,
+            'is_nested': is_nested,
+            'nesting_level': nesting_level,
+            'group_prefix': group_prefix
+        }
     
-    def _validate_complex_form_structure(self, fields: List[Dict[str, Any]], type_counts: Dict[str, int]):
+    def _validate_complex_form_structure(self, by_type: Dict[str, List[str]], type_counts: Dict[str, int]):
         """
         Validate complex form structure against expected patterns (like LIFE-1528-Q).
         
         Args:
-            fields: List of extracted fields
+            by_type: Field names grouped by detected type
             type_counts: Count of each field type
         """
         # Expected LIFE-1528-Q structure:
@@ -347,23 +456,28 @@ class PyPDFFormFieldRenamer:
         self.logger.info(f"  TextFields: {text_fields} (expected: ~45)")
         
         # Validate RadioGroup patterns
-        radio_group_fields = [f for f in fields if f['type'] == 'RadioGroup']
-        if radio_group_fields:
+        radio_group_names = by_type.get('RadioGroup')
+        if radio_group_names:
             self.logger.info(f"RadioGroup fields detected:")
-            for field in radio_group_fields:
-                self.logger.info(f"  - {field['name']}")
+            for name in radio_group_names:
+                self.logger.info(f"  - {name}")
         
         # Warn if numbers are significantly off
-        if radio_groups == 0 and len(fields) > 50:
+        total_fields = sum(type_counts.values())
+        if radio_groups == 0 and total_fields > 50:
             self.logger.warning("No RadioGroups detected in complex form - possible detection issue")
         
-        if radio_buttons == 0 and len(fields) > 50:
+        if radio_buttons == 0 and total_fields > 50:
             self.logger.warning("No RadioButtons detected in complex form - possible detection issue")
     
     def rename_fields(self, mappings: Dict[str, str]) -> List[FieldRenameResult]:
         """
         Rename multiple fields with progress tracking.
         
+        The mappings apply all at once: every source name refers to a field in
+        the form as loaded, so chained (a → b, c → a) and swapped (a → b,
+        b → a) renames work.
+        
         Args:
             mappings: Dictionary mapping old field names to new field names
             
@@ -373,10 +487,9 @@ class PyPDFFormFieldRenamer:
         if not self.wrapper:
             raise RuntimeError("PDF not loaded. Call load_pdf() first.")
         
-        results = []
         total_fields = len(mappings)
         
-        self.logger.info(f"Starting field renaming: {total_fields} fields")
+        self.logger.info("Starting field renaming: %d fields", total_fields)
         
         # Report initial progress
         if self.progress_callback:
@@ -389,31 +502,68 @@ class PyPDFFormFieldRenamer:
             )
             self.progress_callback(progress)
         
-        import time
-        start_time = time.time()
+        perf_counter = time.perf_counter
+        start_time = perf_counter()
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # PyPDFForm rewrites the whole PDF on every immediate update_widget_key;
+        # when deferral is supported, queue every rename and rewrite it once
+        wrapper = self.wrapper
+        deferred = hasattr(wrapper, 'commit_widget_key_updates')
+        logger = self.logger
+        progress_callback = self.progress_callback
+        
+        # Source names are checked against the form as loaded; unknown ones
+        # fail here with a set lookup instead of a call into PyPDFForm
+        before_keys = frozenset(wrapper.widgets)
+        
+        # All renames apply at once, so an entry may take a name that another
+        # entry renames away (chains such as a → b, c → a, and swaps). Those
+        # targets go through a temporary name that is only resolved after
+        # every source has been moved off its old name.
+        sources = {
+            old_name for old_name, new_name in mappings.items()
+            if old_name in before_keys and old_name != new_name
+        }
+        
+        def _rename(old_key: str, new_key: str):
+            nonlocal wrapper
+            if deferred:
+                wrapper.update_widget_key(old_key, new_key, defer=True)
+            else:
+                wrapper = wrapper.update_widget_key(old_key, new_key)
         
+        results = [None] * total_fields
+        staged = []
         for i, (old_name, new_name) in enumerate(mappings.items(), 1):
             result = FieldRenameResult(
                 success=False,
                 old_name=old_name,
-                new_name=new_name
+                new_name=new_name,
+                error=None
             )
             
-            try:
-                # Attempt to rename the field using PyPDFForm's update_widget_key
-                self.wrapper = self.wrapper.update_widget_key(old_name, new_name)
-                result.success = True
-                self.logger.debug(f"Successfully renamed: {old_name} → {new_name}")
-                
-            except Exception as e:
-                result.error = str(e)
-                self.logger.warning(f"Failed to rename {old_name} → {new_name}: {e}")
+            if old_name not in before_keys:
+                result.error = f"Field not found: {old_name}"
+            elif old_name in sources:
+                try:
+                    # Attempt to rename the field using PyPDFForm's update_widget_key
+                    if new_name in sources:
+                        temp_name = f"__rename_{i}_{old_name}"
+                        _rename(old_name, temp_name)
+                        staged.append((result, temp_name))
+                    else:
+                        _rename(old_name, new_name)
+                    
+                except Exception as e:
+                    result.error = str(e)
+                    logger.warning("Failed to rename %s → %s: %s", old_name, new_name, e)
             
-            results.append(result)
+            results[i - 1] = result
             
-            # Report progress
-            if self.progress_callback:
-                elapsed = time.time() - start_time
+            # Report progress every 16 fields (and on the last one) rather than per field
+            if progress_callback and ((i & 15) == 0 or i == total_fields):
+                elapsed = perf_counter() - start_time
                 progress = ProgressUpdate(
                     current=i,
                     total=total_fields,
@@ -421,19 +571,56 @@ class PyPDFFormFieldRenamer:
                     operation=f"Renaming field {i}/{total_fields}",
                     elapsed_time=elapsed
                 )
-                self.progress_callback(progress)
+                progress_callback(progress)
+        
+        # Every source has left its old name; move the staged ones into place
+        if staged:
+            if deferred:
+                # PyPDFForm matches queued keys against the widgets it knew
+                # when they were queued, so commit the temporary names first
+                wrapper = wrapper.commit_widget_key_updates()
+            for result, temp_name in staged:
+                try:
+                    _rename(temp_name, result.new_name)
+                except Exception as e:
+                    result.error = str(e)
+                    logger.warning("Failed to rename %s → %s: %s", result.old_name, result.new_name, e)
+        
+        if deferred:
+            wrapper = wrapper.commit_widget_key_updates()
+        self.wrapper = wrapper
+        
+        # Verify each attempted rename by diffing the form's keys against the
+        # names that should now exist, instead of trusting a clean return
+        # from PyPDFForm (it silently ignores unknown keys)
+        after_keys = frozenset(wrapper.widgets)
+        expected_keys = (before_keys - sources) | {mappings[old_name] for old_name in sources}
+        for result in results:
+            if result.error is not None:
+                continue
+            if result.new_name not in after_keys or (
+                result.old_name in after_keys and result.old_name not in expected_keys
+            ):
+                result.error = f"Rename did not take effect: {result.old_name}"
+            else:
+                result.success = True
+                if debug_enabled:
+                    logger.debug("Successfully renamed: %s → %s", result.old_name, result.new_name)
+        
+        # Field keys changed; the next sample_data access must re-read them
+        self._sample_data_cache = None
         
         # Report completion
         successful = sum(1 for r in results if r.success)
         success_rate = (successful / total_fields) * 100 if total_fields > 0 else 0
         
         self.logger.info(
-            f"Field renaming completed: {successful}/{total_fields} "
-            f"successful ({success_rate:.1f}%)"
+            "Field renaming completed: %d/%d successful (%.1f%%)",
+            successful, total_fields, success_rate
         )
         
         if self.progress_callback:
-            elapsed = time.time() - start_time
+            elapsed = perf_counter() - start_time
             progress = ProgressUpdate(
                 current=total_fields,
                 total=total_fields,
@@ -445,12 +632,18 @@ class PyPDFFormFieldRenamer:
         
         return results
     
-    def validate_mappings(self, mappings: Dict[str, str]) -> Dict[str, List[str]]:
+    def validate_mappings(
+        self,
+        mappings: Dict[str, str],
+        existing_fields: Optional[List[str]] = None
+    ) -> Dict[str, List[str]]:
         """
         Validate field mappings before applying changes.
         
         Args:
             mappings: Dictionary of field name mappings to validate
+            existing_fields: Optional list of field names already extracted
+                from the PDF (e.g. from a field cache) to check sources against
             
         Returns:
             Dictionary with 'errors' and 'warnings' lists
@@ -464,20 +657,23 @@ class PyPDFFormFieldRenamer:
             validation_results['errors'].append("No field mappings provided")
             return validation_results
         
-        # Check for duplicate target names
-        new_names = list(mappings.values())
-        duplicates = set([name for name in new_names if new_names.count(name) > 1])
-        if duplicates:
-            validation_results['errors'].extend([
-                f"Duplicate target name: {name}" for name in duplicates
-            ])
+        # Check for duplicate target names (single counting pass)
+        target_counts = Counter(mappings.values())
+        errors = [
+            f"Duplicate target name: {name}"
+            for name, count in target_counts.items() if count > 1
+        ]
         
         # Check for empty names
-        for old_name, new_name in mappings.items():
-            if not old_name.strip():
-                validation_results['errors'].append("Empty source field name found")
-            if not new_name.strip():
-                validation_results['errors'].append(f"Empty target name for field: {old_name}")
+        errors.extend([
+            "Empty source field name found"
+            for old_name in mappings if not old_name.strip()
+        ])
+        errors.extend([
+            f"Empty target name for field: {old_name}"
+            for old_name, new_name in mappings.items() if not new_name.strip()
+        ])
+        validation_results['errors'].extend(errors)
         
         # Check for self-mappings (unnecessary operations)
         self_mappings = [old for old, new in mappings.items() if old == new]
@@ -487,6 +683,14 @@ class PyPDFFormFieldRenamer:
                 for name in self_mappings
             ])
         
+        # Check source names against known PDF fields (no PDF traversal needed)
+        if existing_fields is not None:
+            known_fields = set(existing_fields)
+            validation_results['warnings'].extend([
+                f"Source field not found in PDF: {old}"
+                for old in mappings if old not in known_fields
+            ])
+        
         self.logger.info(
             f"Validation completed: {len(validation_results['errors'])} errors, "
             f"{len(validation_results['warnings'])} warnings"
@@ -541,16 +745,20 @@ class PyPDFFormFieldRenamer:
             'total_fields': len(mappings),
             'validation_results': validation_results,
             'estimated_success_rate': 'To be determined',  # Will be validated during testing
-            'preview_mappings': [
-                {
-                    'old_name': old,
-                    'new_name': new,
-                    'status': 'ready' if not validation_results['errors'] else 'blocked'
-                }
-                for old, new in mappings.items()
-            ]
         }
         
+        # Validation errors block every mapping, so skip building per-field entries
+        if validation_results['errors']:
+            preview['status'] = 'blocked_all'
+            preview['preview_mappings'] = []
+            return preview
+        
+        preview['status'] = 'ready'
+        preview['preview_mappings'] = [
+            {'old_name': old, 'new_name': new, 'status': 'ready'}
+            for old, new in mappings.items()
+        ]
+        
         return preview
     
     @staticmethod
@@ -1,11 +1,70 @@
 #!/usr/bin/env python3
 import sys
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
+def process_one(pdf_path: Path) -> dict:
+    """
+    Test a single PDF; runs in a worker process.
+    
+    Output lines are collected in the result's 'log' entry instead of being
+    printed, so parallel workers don't interleave their output.
+    
+    Args:
+        pdf_path: Path to the training PDF
+        
+    Returns:
+        Result dictionary for the PDF
+    """
+    # Import in the worker so spawn-based platforms (macOS/Windows) don't
+    # depend on state inherited from the parent process
+    from PyPDFForm import PdfWrapper
+    from pdf_modifier.pypdfform_field_renamer import PyPDFFormFieldRenamer
+    
+    log = [f"📄 Testing {pdf_path.name}..."]
+    
+    try:
+        # Test PyPDFForm basic
+        pdf = PdfWrapper(str(pdf_path))
+        
+        # Wrap the parsed PDF up front so sample_data is read once and
+        # shared with extract_fields() below
+        renamer = PyPDFFormFieldRenamer.from_wrapper(pdf, str(pdf_path))
+        sample_data = renamer.sample_data
+        
+        if sample_data:
+            log.append(f"  ✅ PyPDFForm: {len(sample_data)} fields detected")
+            
+            # Test wrapper
+            fields = renamer.extract_fields()
+            log.append(f"  ✅ Wrapper: {len(fields)} fields extracted")
+            
+            # Count field types
+            type_counts = dict(Counter(field['type'] for field in fields))
+            
+            log.append(f"  📊 Field types: {type_counts}")
+            
+            return {
+                'name': pdf_path.name,
+                'success': True,
+                'pypdfform_count': len(sample_data),
+                'wrapper_count': len(fields),
+                'field_types': type_counts,
+                'log': log
+            }
+        else:
+            log.append(f"  ❌ PyPDFForm: No sample_data")
+            return {'name': pdf_path.name, 'success': False, 'error': 'No sample_data', 'log': log}
+            
+    except Exception as e:
+        log.append(f"  ❌ Error: {e}")
+        return {'name': pdf_path.name, 'success': False, 'error': str(e), 'log': log}
+
 def main():
     print("Testing PyPDFForm with all training PDFs...")
     
@@ -38,50 +97,14 @@ def main():
     for pdf in clean_pdfs:
         print(f"  - {pdf.name}")
     
-    # Test each PDF
-    results = []
-    for pdf_path in clean_pdfs:
-        print(f"\n📄 Testing {pdf_path.name}...")
-        
-        try:
-            # Test PyPDFForm basic
-            pdf = PdfWrapper(str(pdf_path))
-            sample_data = pdf.sample_data
-            
-            if sample_data:
-                print(f"  ✅ PyPDFForm: {len(sample_data)} fields detected")
-                
-                # Test wrapper
-                renamer = PyPDFFormFieldRenamer(str(pdf_path))
-                if renamer.load_pdf():
-                    fields = renamer.extract_fields()
-                    print(f"  ✅ Wrapper: {len(fields)} fields extracted")
-                    
-                    # Count field types
-                    type_counts = {}
-                    for field in fields:
-                        field_type = field['type']
-                        type_counts[field_type] = type_counts.get(field_type, 0) + 1
-                    
-                    print(f"  📊 Field types: {type_counts}")
-                    
-                    results.append({
-                        'name': pdf_path.name,
-                        'success': True,
-                        'pypdfform_count': len(sample_data),
-                        'wrapper_count': len(fields),
-                        'field_types': type_counts
-                    })
-                else:
-                    print(f"  ❌ Wrapper failed to load PDF")
-                    results.append({'name': pdf_path.name, 'success': False, 'error': 'Wrapper load failed'})
-            else:
-                print(f"  ❌ PyPDFForm: No sample_data")
-                results.append({'name': pdf_path.name, 'success': False, 'error': 'No sample_data'})
-                
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            results.append({'name': pdf_path.name, 'success': False, 'error': str(e)})
+    # Test each PDF in its own process; every PDF is independent and
+    # parsing/classification is CPU-bound, so threads would not help
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(process_one, clean_pdfs, chunksize=1))
+    
+    # Print per-PDF output in submission order, not completion order
+    for result in results:
+        print("\n" + "\n".join(result.pop('log')))
     
     # Summary
     print("\n" + "="*60)
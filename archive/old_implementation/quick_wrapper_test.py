@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import sys
+from collections import Counter
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent / "src"))
 
@@ -21,10 +22,7 @@ try:
             print(f"📊 Fields extracted: {len(fields)}")
             
             # Count field types
-            type_counts = {}
-            for field in fields:
-                field_type = field['type']
-                type_counts[field_type] = type_counts.get(field_type, 0) + 1
+            type_counts = Counter(field['type'] for field in fields)
             
             print("Field types:")
             for field_type, count in type_counts.items():
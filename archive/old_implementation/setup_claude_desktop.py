@@ -6,14 +6,30 @@ PDFParseV2 - Automated Claude Desktop Integration Setup
 This script automatically configures Claude Desktop for MCP integration.
 """
 
+import importlib.util
 import json
+import mmap
 import os
-import shutil
-import subprocess
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Project location, resolved once instead of in every function
+PROJECT_ROOT = Path("/Users/wseke/Desktop/PDFParseV2")
+MCP_SERVER_PATH = PROJECT_ROOT / "src" / "pdf_modifier" / "mcp_server.py"
+
+# Byte strings that must appear in a valid MCP server file
+_SERVER_MARKERS = (b"Server", b"MCP")
+_SERVER_MARKER_RE = re.compile(b"|".join(map(re.escape, _SERVER_MARKERS)))
+
+def _ensure_on_path(path: Path) -> None:
+    """Put path at the front of sys.path unless it is already there."""
+    entry = str(path)
+    if entry not in sys.path:
+        sys.path.insert(0, entry)
+
 def get_claude_desktop_config_path() -> Optional[Path]:
     """Get the Claude Desktop configuration file path for the current platform."""
     
@@ -35,6 +51,13 @@ def ensure_directory_exists(path: Path) -> bool:
         print(f"❌ Error creating directory {path.parent}: {e}")
         return False
 
+def _is_installed(package: str) -> bool:
+    """Check whether a package can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
 def check_dependencies() -> bool:
     """Check if required dependencies are installed."""
     print("🔍 Checking dependencies...")
@@ -51,13 +74,21 @@ def check_dependencies() -> bool:
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package)
-            print(f"✅ {package} - OK")
-        except ImportError:
-            print(f"❌ {package} - Missing")
+    # find_spec only locates each package; importing it would run its
+    # (often heavy) module init just to learn that it is installed.
+    # The lookups are filesystem-bound, so probe them concurrently.
+    with ThreadPoolExecutor(max_workers=len(required_packages)) as executor:
+        installed = list(executor.map(_is_installed, required_packages))
+    
+    # Collect the report and write it in one print instead of one per package
+    lines = []
+    for package, ok in zip(required_packages, installed):
+        if ok:
+            lines.append(f"✅ {package} - OK")
+        else:
+            lines.append(f"❌ {package} - Missing")
             missing_packages.append(package)
+    print("\n".join(lines))
     
     if missing_packages:
         print(f"\n⚠️  Missing dependencies: {', '.join(missing_packages)}")
@@ -69,18 +100,16 @@ def check_dependencies() -> bool:
 def create_mcp_config() -> Dict[str, Any]:
     """Create the MCP server configuration."""
     
-    project_root = Path("/Users/wseke/Desktop/PDFParseV2")
-    
     config = {
         "mcpServers": {
             "pdf-field-modifier": {
                 "command": "python3",
                 "args": [
-                    str(project_root / "src" / "pdf_modifier" / "mcp_server.py")
+                    str(MCP_SERVER_PATH)
                 ],
-                "cwd": str(project_root),
+                "cwd": str(PROJECT_ROOT),
                 "env": {
-                    "PYTHONPATH": str(project_root)
+                    "PYTHONPATH": str(PROJECT_ROOT)
                 },
                 "description": "PDF Field Modifier - AI-powered PDF form field renaming engine"
             }
@@ -95,16 +124,19 @@ def create_mcp_config() -> Dict[str, Any]:
 
 def backup_existing_config(config_path: Path) -> Optional[Path]:
     """Backup existing configuration if it exists."""
-    if config_path.exists():
-        backup_path = config_path.with_suffix(".json.backup")
-        try:
-            shutil.copy2(config_path, backup_path)
-            print(f"✅ Backed up existing config to: {backup_path}")
-            return backup_path
-        except Exception as e:
-            print(f"❌ Error backing up config: {e}")
-            return None
-    return None
+    import shutil
+    
+    # Let the copy report a missing config rather than stat()ing it first
+    backup_path = config_path.with_suffix(".json.backup")
+    try:
+        shutil.copy2(config_path, backup_path)
+        print(f"✅ Backed up existing config to: {backup_path}")
+        return backup_path
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"❌ Error backing up config: {e}")
+        return None
 
 def install_config(config: Dict[str, Any], config_path: Path) -> bool:
     """Install the configuration file."""
@@ -113,9 +145,11 @@ def install_config(config: Dict[str, Any], config_path: Path) -> bool:
         if not ensure_directory_exists(config_path):
             return False
         
-        # Write configuration
+        # Write configuration; render it first so it goes out in one write()
+        # rather than one per encoder chunk as json.dump does
+        rendered = json.dumps(config, indent=2)
         with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+            f.write(rendered)
         
         print(f"✅ Configuration installed to: {config_path}")
         return True
@@ -126,22 +160,33 @@ def install_config(config: Dict[str, Any], config_path: Path) -> bool:
 
 def verify_mcp_server() -> bool:
     """Verify the MCP server file exists and is valid."""
-    project_root = Path("/Users/wseke/Desktop/PDFParseV2")
-    server_path = project_root / "src" / "pdf_modifier" / "mcp_server.py"
+    server_path = MCP_SERVER_PATH
     
-    if not server_path.exists():
+    # Open directly; a missing file surfaces as FileNotFoundError, which
+    # saves the separate exists() stat
+    try:
+        with open(server_path, 'rb') as f:
+            # Search the mapped bytes in place instead of decoding the whole
+            # file into a str; an empty file cannot be mapped (or match).
+            # One forward scan, stopping as soon as both markers are seen.
+            missing = set(_SERVER_MARKERS)
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for match in _SERVER_MARKER_RE.finditer(mm):
+                        missing.discard(match.group())
+                        if not missing:
+                            break
+            verified = not missing
+        
+        if verified:
+            print(f"✅ MCP server file verified: {server_path}")
+            return True
+        else:
+            print(f"❌ MCP server file doesn't contain expected content")
+            return False
+    except FileNotFoundError:
         print(f"❌ MCP server file not found: {server_path}")
         return False
-    
-    try:
-        with open(server_path, 'r') as f:
-            content = f.read()
-            if "Server" in content and "MCP" in content:
-                print(f"✅ MCP server file verified: {server_path}")
-                return True
-            else:
-                print(f"❌ MCP server file doesn't contain expected content")
-                return False
     except Exception as e:
         print(f"❌ Error reading MCP server file: {e}")
         return False
@@ -151,8 +196,7 @@ def test_mcp_server() -> bool:
     print("🧪 Testing MCP server...")
     
     try:
-        project_root = Path("/Users/wseke/Desktop/PDFParseV2")
-        sys.path.insert(0, str(project_root))
+        _ensure_on_path(PROJECT_ROOT)
         
         # Try to import the server
         from src.pdf_modifier import mcp_server
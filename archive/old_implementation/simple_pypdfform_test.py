@@ -5,10 +5,13 @@ Tests basic functionality with W-4R PDF
 """
 
 import sys
+from itertools import islice
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+# Add src to path (once, even if this module is imported again)
+_SRC_DIR = str(Path(__file__).parent / "src")
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
 def test_pypdfform():
     print("Testing PyPDFForm with W-4R PDF...")
@@ -36,8 +39,10 @@ def test_pypdfform():
         print(f"✅ Found {len(sample_data)} fields")
         
         # Show first few fields
-        for i, (name, value) in enumerate(list(sample_data.items())[:3]):
-            print(f"  Field {i+1}: {name} = {value}")
+        print("\n".join(
+            f"  Field {i+1}: {name} = {value}"
+            for i, (name, value) in enumerate(islice(sample_data.items(), 3))
+        ))
         
         return True
         
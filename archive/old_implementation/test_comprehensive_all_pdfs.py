@@ -13,42 +13,71 @@ This script validates PyPDFForm performance with:
 
 import sys
 import os
+import inspect
+import shelve
 import time
 import pandas as pd
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+from field_cache import cache_key
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
-def get_pdf_csv_pairs():
-    """Get all PDF/CSV pairs from training data directory."""
+# Name fragments marking test output PDFs, not training data
+_SKIP_MARKERS = ('backup', 'test', 'renamed')
+
+@lru_cache(maxsize=1)
+def get_pdf_csv_pairs() -> Tuple[Dict[str, str], ...]:
+    """
+    Get all PDF/CSV pairs from training data directory.
+    
+    The directory is listed once and CSV matches are checked against that
+    listing rather than stat'ing each candidate; the result is cached for
+    the rest of the run. Callers must treat the returned dicts as read-only.
+    
+    Returns:
+        Tuple of pair dicts with 'pdf_path', 'csv_path' and 'name', sorted by name
+    """
     pairs_dir = Path("training_data/pdf_csv_pairs")
-    pdf_files = list(pairs_dir.glob("*_parsed.pdf"))
-    
-    pdf_csv_pairs = []
-    for pdf_file in pdf_files:
-        # Skip test output files
-        if any(skip in pdf_file.name for skip in ['backup', 'test', 'renamed']):
-            continue
-            
-        # Find corresponding CSV file
-        csv_name = pdf_file.name.replace('.pdf', '_correct_mapping.csv')
-        csv_file = pairs_dir / csv_name
-        
-        if csv_file.exists():
-            pdf_csv_pairs.append({
-                'pdf_path': str(pdf_file),
-                'csv_path': str(csv_file),
-                'name': pdf_file.stem.replace('_parsed', '')
-            })
+    try:
+        file_names = {entry.name for entry in pairs_dir.iterdir()}
+    except FileNotFoundError:
+        return ()
+    
+    # Filter lazily: skip test output files and PDFs with no mapping CSV
+    paired_pdfs = (
+        pdf_name for pdf_name in file_names
+        if pdf_name.endswith('_parsed.pdf')
+        and not any(skip in pdf_name for skip in _SKIP_MARKERS)
+        and pdf_name.replace('.pdf', '_correct_mapping.csv') in file_names
+    )
+    
+    pdf_csv_pairs = (
+        {
+            'pdf_path': str(pairs_dir / pdf_name),
+            'csv_path': str(pairs_dir / pdf_name.replace('.pdf', '_correct_mapping.csv')),
+            'name': pdf_name[:-len('.pdf')].replace('_parsed', '')
+        }
+        for pdf_name in paired_pdfs
+    )
     
-    return sorted(pdf_csv_pairs, key=lambda x: x['name'])
+    return tuple(sorted(pdf_csv_pairs, key=lambda x: x['name']))
+
+_EXPECTED_COLUMNS = ['ID', 'Parent ID', 'Api name', 'Acrofieldlabel', 'Type']
 
 def analyze_expected_fields(csv_path: str) -> Dict[str, Any]:
     """Analyze expected fields from CSV training data."""
     try:
-        df = pd.read_csv(csv_path)
+        # Only these columns are used; naming them and reading them as str
+        # skips parsing the wide description columns and per-column inference.
+        # Type stays str rather than category so value_counts() keeps ties in
+        # first-seen order for the report.
+        df = pd.read_csv(csv_path, usecols=_EXPECTED_COLUMNS, dtype=str)
         
         # Basic field analysis
         field_analysis = {
@@ -59,17 +88,27 @@ def analyze_expected_fields(csv_path: str) -> Dict[str, Any]:
             'parent_relationships': []
         }
         
-        # Analyze parent-child relationships
-        for _, row in df.iterrows():
-            if pd.notna(row['Parent ID']) and row['Parent ID'] != 'Delete Parent ID':
-                parent_row = df[df['ID'] == row['Parent ID']]
-                if len(parent_row) > 0:
-                    field_analysis['parent_relationships'].append({
-                        'child': row['Api name'],
-                        'parent': parent_row['Api name'].iloc[0],
-                        'child_type': row['Type'],
-                        'parent_type': parent_row['Type'].iloc[0]
-                    })
+        # Analyze parent-child relationships: index the rows by ID once so
+        # each parent lookup is a dict hit instead of a scan of the frame.
+        # Built in reverse so the first row wins for a duplicated ID.
+        id_rows = df[['ID', 'Api name', 'Type']].iloc[::-1].itertuples(index=False, name=None)
+        id_to_row = {row_id: (api_name, field_type) for row_id, api_name, field_type in id_rows}
+        
+        # Select the child rows with a vectorized mask so only they are
+        # visited in Python
+        parent_ids = df['Parent ID']
+        children = df[parent_ids.notna() & (parent_ids != 'Delete Parent ID')]
+        
+        child_rows = children[['Parent ID', 'Api name', 'Type']].itertuples(index=False, name=None)
+        for parent_id, api_name, field_type in child_rows:
+            parent = id_to_row.get(parent_id)
+            if parent is not None:
+                field_analysis['parent_relationships'].append({
+                    'child': api_name,
+                    'parent': parent[0],
+                    'child_type': field_type,
+                    'parent_type': parent[1]
+                })
         
         return field_analysis
         
@@ -77,35 +116,38 @@ def analyze_expected_fields(csv_path: str) -> Dict[str, Any]:
         print(f"❌ Failed to analyze {csv_path}: {e}")
         return {}
 
-def test_pypdfform_basic(pdf_path: str) -> Tuple[bool, Dict[str, Any]]:
-    """Test basic PyPDFForm functionality."""
+def test_pypdfform_basic(pdf) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Test basic PyPDFForm functionality on an already loaded PdfWrapper.
+    
+    The sample_data read here is returned so the wrapper stage can hand it to
+    its renamer instead of walking the form again.
+    """
+    if pdf is None:
+        return False, {'error': 'Failed to load PDF'}
+    
     try:
-        from PyPDFForm import PdfWrapper
-        
-        pdf = PdfWrapper(pdf_path)
         sample_data = pdf.sample_data
         
         if not sample_data:
             return False, {'error': 'No sample_data returned'}
         
-        # Analyze field types
-        field_types = {}
-        for field_name in sample_data.keys():
-            if field_name.endswith('--group'):
-                field_types[field_name] = 'RadioGroup'
-            elif '--' in field_name and not field_name.endswith('--group'):
-                field_types[field_name] = 'RadioButton'
-            else:
-                field_types[field_name] = 'TextField'
-        
-        # Count field types
-        type_counts = {}
-        for field_type in field_types.values():
-            type_counts[field_type] = type_counts.get(field_type, 0) + 1
+        # Count field types with two C-level scans over the names instead of
+        # classifying each key in Python; every '--group' name also contains
+        # '--', so buttons are the '--' names that aren't groups
+        field_names = list(sample_data)
+        groups = sum(name.endswith('--group') for name in field_names)
+        buttons = sum('--' in name for name in field_names) - groups
+        counts = {
+            'RadioGroup': groups,
+            'RadioButton': buttons,
+            'TextField': len(field_names) - groups - buttons
+        }
+        type_counts = {field_type: n for field_type, n in counts.items() if n}
         
         return True, {
             'total_fields': len(sample_data),
-            'field_names': list(sample_data.keys()),
+            'field_names': field_names,
             'field_types': type_counts,
             'sample_data': sample_data
         }
@@ -113,16 +155,12 @@ def test_pypdfform_basic(pdf_path: str) -> Tuple[bool, Dict[str, Any]]:
     except Exception as e:
         return False, {'error': str(e)}
 
-def test_pypdfform_wrapper(pdf_path: str) -> Tuple[bool, Dict[str, Any]]:
-    """Test PyPDFForm wrapper functionality."""
+def test_pypdfform_wrapper(renamer) -> Tuple[bool, Dict[str, Any]]:
+    """Test PyPDFForm wrapper functionality on an already loaded renamer."""
+    if renamer is None:
+        return False, {'error': 'Renamer not available'}
+    
     try:
-        from pdf_modifier.pypdfform_field_renamer import PyPDFFormFieldRenamer
-        
-        renamer = PyPDFFormFieldRenamer(pdf_path)
-        
-        if not renamer.load_pdf():
-            return False, {'error': 'Failed to load PDF'}
-        
         fields = renamer.extract_fields()
         
         if not fields:
@@ -144,18 +182,17 @@ def test_pypdfform_wrapper(pdf_path: str) -> Tuple[bool, Dict[str, Any]]:
     except Exception as e:
         return False, {'error': str(e)}
 
-def test_field_renaming(pdf_path: str) -> Tuple[bool, Dict[str, Any]]:
-    """Test field renaming functionality."""
+def test_field_renaming(renamer, fields: List[Any]) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Test field renaming functionality.
+    
+    Runs last: it renames a field on the shared renamer, using the fields
+    already extracted by test_pypdfform_wrapper.
+    """
+    if renamer is None:
+        return False, {'error': 'Renamer not available'}
+    
     try:
-        from pdf_modifier.pypdfform_field_renamer import PyPDFFormFieldRenamer
-        
-        renamer = PyPDFFormFieldRenamer(pdf_path)
-        
-        if not renamer.load_pdf():
-            return False, {'error': 'Failed to load PDF'}
-        
-        fields = renamer.extract_fields()
-        
         if not fields:
             return False, {'error': 'No fields for renaming'}
         
@@ -187,9 +224,21 @@ def test_field_renaming(pdf_path: str) -> Tuple[bool, Dict[str, Any]]:
     except Exception as e:
         return False, {'error': str(e)}
 
+# Per-field data that test_single_pdf() strips from its result once used
+_EXPECTED_PAYLOAD_KEYS = ('api_names', 'field_labels', 'parent_relationships')
+_TEST_PAYLOAD_KEYS = ('sample_data', 'fields', 'field_names')
+
+# Error recorded for stages that don't run after PyPDFForm fails on a PDF
+_SKIPPED_ERROR = 'skipped: upstream PyPDFForm failure'
+
 def test_single_pdf(pdf_info: Dict[str, str]) -> Dict[str, Any]:
-    """Test a single PDF with all validation steps."""
-    print(f"\n📄 Testing {pdf_info['name']}...")
+    """
+    Test a single PDF with all validation steps.
+    
+    Runs in a worker process, so progress lines are collected in the
+    result's 'log' entry for the parent to print instead of being printed.
+    """
+    log = [f"📄 Testing {pdf_info['name']}..."]
     
     start_time = time.time()
     results = {
@@ -198,7 +247,8 @@ def test_single_pdf(pdf_info: Dict[str, str]) -> Dict[str, Any]:
         'csv_path': pdf_info['csv_path'],
         'tests': {},
         'performance': {},
-        'success': False
+        'success': False,
+        'log': log
     }
     
     # Step 1: Analyze expected fields
@@ -209,43 +259,79 @@ def test_single_pdf(pdf_info: Dict[str, str]) -> Dict[str, Any]:
         results['tests']['expected_analysis'] = {'success': False, 'error': 'Failed to analyze expected fields'}
         return results
     
-    print(f"  📊 Expected: {expected['total_fields']} fields")
+    log.append(f"  📊 Expected: {expected['total_fields']} fields")
+    
+    # Parse the PDF once; all three stages below share this PdfWrapper
+    # instead of re-parsing the file each
+    try:
+        from PyPDFForm import PdfWrapper
+        
+        pdf = PdfWrapper(pdf_info['pdf_path'])
+    except Exception as e:
+        log.append(f"  ❌ Failed to load PDF: {e}")
+        pdf = None
     
     # Step 2: Test PyPDFForm basic
-    pypdfform_success, pypdfform_data = test_pypdfform_basic(pdf_info['pdf_path'])
+    pypdfform_success, pypdfform_data = test_pypdfform_basic(pdf)
     results['tests']['pypdfform_basic'] = {
         'success': pypdfform_success,
         'data': pypdfform_data
     }
     
     if pypdfform_success:
-        print(f"  ✅ PyPDFForm: {pypdfform_data['total_fields']} fields detected")
+        log.append(f"  ✅ PyPDFForm: {pypdfform_data['total_fields']} fields detected")
     else:
-        print(f"  ❌ PyPDFForm failed: {pypdfform_data.get('error', 'Unknown error')}")
+        log.append(f"  ❌ PyPDFForm failed: {pypdfform_data.get('error', 'Unknown error')}")
     
-    # Step 3: Test PyPDFForm wrapper
-    wrapper_success, wrapper_data = test_pypdfform_wrapper(pdf_info['pdf_path'])
-    results['tests']['pypdfform_wrapper'] = {
-        'success': wrapper_success,
-        'data': wrapper_data
-    }
-    
-    if wrapper_success:
-        print(f"  ✅ Wrapper: {wrapper_data['total_fields']} fields detected")
-    else:
-        print(f"  ❌ Wrapper failed: {wrapper_data.get('error', 'Unknown error')}")
-    
-    # Step 4: Test field renaming
-    renaming_success, renaming_data = test_field_renaming(pdf_info['pdf_path'])
-    results['tests']['field_renaming'] = {
-        'success': renaming_success,
-        'data': renaming_data
-    }
-    
-    if renaming_success:
-        print(f"  ✅ Renaming: {renaming_data['original_name']} → {renaming_data['new_name']}")
+    # The wrapper and renaming stages work on the same parsed form; if
+    # PyPDFForm couldn't read it they would only fail again, so skip them
+    if pypdfform_success:
+        # Step 3: Test PyPDFForm wrapper, around the already parsed form
+        renamer = None
+        try:
+            from pdf_modifier.pypdfform_field_renamer import PyPDFFormFieldRenamer
+            
+            renamer = PyPDFFormFieldRenamer.from_wrapper(
+                pdf, pdf_info['pdf_path'], sample_data=pypdfform_data['sample_data']
+            )
+        except Exception as e:
+            wrapper_success, wrapper_data = False, {'error': f"Failed to create renamer: {e}"}
+        else:
+            wrapper_success, wrapper_data = test_pypdfform_wrapper(renamer)
+        results['tests']['pypdfform_wrapper'] = {
+            'success': wrapper_success,
+            'data': wrapper_data
+        }
+        
+        if wrapper_success:
+            log.append(f"  ✅ Wrapper: {wrapper_data['total_fields']} fields detected")
+        else:
+            log.append(f"  ❌ Wrapper failed: {wrapper_data.get('error', 'Unknown error')}")
+        
+        # Step 4: Test field renaming
+        renaming_success, renaming_data = test_field_renaming(renamer, wrapper_data.get('fields', []))
+        results['tests']['field_renaming'] = {
+            'success': renaming_success,
+            'data': renaming_data
+        }
+        
+        if renaming_success:
+            log.append(f"  ✅ Renaming: {renaming_data['original_name']} → {renaming_data['new_name']}")
+        else:
+            log.append(f"  ❌ Renaming failed: {renaming_data.get('error', 'Unknown error')}")
     else:
-        print(f"  ❌ Renaming failed: {renaming_data.get('error', 'Unknown error')}")
+        for test_name in ('pypdfform_wrapper', 'field_renaming'):
+            results['tests'][test_name] = {'success': False, 'data': {'error': _SKIPPED_ERROR}}
+        log.append(f"  ⏭️  Wrapper and renaming: {_SKIPPED_ERROR}")
+    
+    # Drop the per-field payloads now that every stage is done; only the
+    # counts and errors are used by the summary, and this keeps each result
+    # small to pickle back from the worker and to hold in all_results
+    for key in _EXPECTED_PAYLOAD_KEYS:
+        expected.pop(key, None)
+    for test in results['tests'].values():
+        for key in _TEST_PAYLOAD_KEYS:
+            test['data'].pop(key, None)
     
     # Performance metrics
     elapsed_time = time.time() - start_time
@@ -266,43 +352,69 @@ def analyze_comprehensive_results(all_results: List[Dict[str, Any]]) -> Dict[str
     print("="*80)
     
     total_pdfs = len(all_results)
-    successful_pdfs = sum(1 for r in all_results if r['success'])
-    
-    # Field detection analysis
-    expected_fields = sum(r['expected']['total_fields'] for r in all_results if r['expected'])
-    pypdfform_fields = sum(r['tests']['pypdfform_basic']['data']['total_fields'] 
-                          for r in all_results 
-                          if r['tests']['pypdfform_basic']['success'])
-    wrapper_fields = sum(r['tests']['pypdfform_wrapper']['data']['total_fields'] 
-                        for r in all_results 
-                        if r['tests']['pypdfform_wrapper']['success'])
-    
-    # Performance analysis
-    total_time = sum(r['performance']['processing_time'] for r in all_results)
-    avg_time = total_time / total_pdfs if total_pdfs > 0 else 0
-    
-    # Field type analysis
-    field_type_accuracy = {}
+    successful_pdfs = 0
+    expected_fields = 0
+    pypdfform_fields = 0
+    wrapper_fields = 0
+    total_time = 0
+    timed_pdfs = 0
+    timed_fields = 0
+    cached_pdfs = 0
+    expected_type_counts = Counter()
+    detected_type_counts = Counter()
+    
+    # Accumulate every total in one pass over the results
     for result in all_results:
+        tests = result['tests']
+        if result['success']:
+            successful_pdfs += 1
+        
+        # Field detection analysis
+        if result['expected']:
+            expected_fields += result['expected']['total_fields']
+        if tests['pypdfform_basic']['success']:
+            pypdfform_fields += tests['pypdfform_basic']['data']['total_fields']
+        if tests['pypdfform_wrapper']['success']:
+            wrapper_fields += tests['pypdfform_wrapper']['data']['total_fields']
+        
+        # Performance analysis; cached results were processed by an earlier
+        # run, so only PDFs tested in this run count toward the timings
+        if result.get('cached'):
+            cached_pdfs += 1
+        else:
+            total_time += result['performance']['processing_time']
+            timed_pdfs += 1
+            if result['expected']:
+                timed_fields += result['expected']['total_fields']
+        
+        # Field type analysis
         if result['success'] and result['expected']:
             expected_types = result['expected']['field_types']
-            detected_types = result['tests']['pypdfform_wrapper']['data']['field_types']
+            detected_types = tests['pypdfform_wrapper']['data']['field_types']
             
-            for field_type, expected_count in expected_types.items():
-                detected_count = detected_types.get(field_type, 0)
-                if field_type not in field_type_accuracy:
-                    field_type_accuracy[field_type] = {'expected': 0, 'detected': 0}
-                field_type_accuracy[field_type]['expected'] += expected_count
-                field_type_accuracy[field_type]['detected'] += detected_count
+            # Detections only count toward types this PDF is expected to have
+            expected_type_counts.update(expected_types)
+            detected_type_counts.update({
+                field_type: detected_types.get(field_type, 0)
+                for field_type in expected_types
+            })
+    
+    avg_time = total_time / timed_pdfs if timed_pdfs > 0 else 0
+    
+    field_type_accuracy = {
+        field_type: {'expected': expected_count, 'detected': detected_type_counts[field_type]}
+        for field_type, expected_count in expected_type_counts.items()
+    }
     
     analysis = {
         'overall_success_rate': (successful_pdfs / total_pdfs) * 100,
         'field_detection_accuracy': (wrapper_fields / expected_fields) * 100 if expected_fields > 0 else 0,
         'performance': {
             'total_processing_time': total_time,
+            'cached_pdfs': cached_pdfs,
             'average_time_per_pdf': avg_time,
-            'total_fields_processed': expected_fields,
-            'fields_per_second': expected_fields / total_time if total_time > 0 else 0
+            'total_fields_processed': timed_fields,
+            'fields_per_second': timed_fields / total_time if total_time > 0 else 0
         },
         'field_type_accuracy': field_type_accuracy,
         'summary': {
@@ -350,6 +462,64 @@ def print_comprehensive_summary(analysis: Dict[str, Any]):
     print(f"  Average per PDF: {perf['average_time_per_pdf']:.2f}s")
     print(f"  Total fields: {perf['total_fields_processed']}")
     print(f"  Processing rate: {perf['fields_per_second']:.1f} fields/second")
+    if perf['cached_pdfs']:
+        print(f"  Served from cache: {perf['cached_pdfs']} PDFs (excluded from timing)")
+
+# Shelve file (relative to the working directory) holding results of
+# earlier runs, so unchanged PDF/CSV pairs aren't tested again
+_RESULT_CACHE_PATH = ".pdf_test_cache"
+
+def _code_stamp() -> Tuple[Any, ...]:
+    """
+    Fingerprint the code under test.
+    
+    Covers this script, the renamer module it actually imports and the
+    installed PyPDFForm version, so changing any of them invalidates every
+    cached result. A file that can't be found stamps as 0.
+    """
+    try:
+        import PyPDFForm
+        from pdf_modifier.pypdfform_field_renamer import PyPDFFormFieldRenamer
+        
+        pypdfform_version = getattr(PyPDFForm, '__version__', None)
+        renamer_module = inspect.getfile(PyPDFFormFieldRenamer)
+    except Exception:
+        pypdfform_version, renamer_module = None, None
+    
+    stamp = [pypdfform_version]
+    for path in (__file__, renamer_module):
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except (OSError, TypeError):
+            stamp.append(0)
+    return tuple(stamp)
+
+def _result_cache_key(pdf_info: Dict[str, str], code_stamp: Tuple[Any, ...]) -> Optional[str]:
+    """
+    Build the result cache key for a PDF/CSV pair.
+    
+    Args:
+        pdf_info: Pair dict from get_pdf_csv_pairs()
+        code_stamp: Result of _code_stamp()
+        
+    Returns:
+        Shelve key string, or None if either file can't be read
+    """
+    try:
+        pdf_key = cache_key(pdf_info['pdf_path'])
+        csv_mtime_ns = os.stat(pdf_info['csv_path']).st_mtime_ns
+    except OSError:
+        return None
+    return repr((pdf_info['pdf_path'], pdf_key, csv_mtime_ns, code_stamp))
+
+def _print_progress(done: int, total: int, result: Dict[str, Any], verb: str):
+    """Print a finished PDF's log and quick status as one block."""
+    status = "✅ PASS" if result['success'] else "❌ FAIL"
+    print("\n".join([
+        f"\n[{done}/{total}] {verb} {result['name']}",
+        *result.pop('log'),
+        f"  {status} - {result['performance']['processing_time']:.2f}s"
+    ]))
 
 def main():
     """Run comprehensive testing with all 14 training PDFs."""
@@ -369,18 +539,54 @@ def main():
     for pair in pdf_csv_pairs:
         print(f"  - {pair['name']}")
     
-    # Test each PDF
-    all_results = []
+    all_results = [None] * len(pdf_csv_pairs)
     start_time = time.time()
-    
-    for i, pdf_info in enumerate(pdf_csv_pairs, 1):
-        print(f"\n[{i}/{len(pdf_csv_pairs)}] Testing {pdf_info['name']}...")
-        result = test_single_pdf(pdf_info)
-        all_results.append(result)
-        
-        # Show quick status
-        status = "✅ PASS" if result['success'] else "❌ FAIL"
-        print(f"  {status} - {result['performance']['processing_time']:.2f}s")
+    done = 0
+    
+    with shelve.open(_RESULT_CACHE_PATH) as result_cache:
+        # Reuse results for pairs whose PDF, CSV and test code are unchanged
+        # since the last run; only the rest are parsed again
+        code_stamp = _code_stamp()
+        cache_keys = []
+        pending = []
+        for index, pdf_info in enumerate(pdf_csv_pairs):
+            key = _result_cache_key(pdf_info, code_stamp)
+            cache_keys.append(key)
+            cached = result_cache.get(key) if key is not None else None
+            if cached is None:
+                pending.append(index)
+                continue
+            
+            # Nothing was processed for this pair in this run, so it is
+            # left out of the timing totals (see analyze_comprehensive_results)
+            cached['cached'] = True
+            all_results[index] = cached
+            done += 1
+            _print_progress(done, len(pdf_csv_pairs), cached, "Cached")
+        
+        # Test each remaining PDF in its own worker process; the PDFs are
+        # independent and parsing is CPU-bound, so processes (not threads)
+        # give the speedup
+        if pending:
+            max_workers = min(os.cpu_count() or 1, len(pending))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(test_single_pdf, pdf_csv_pairs[index]): index
+                    for index in pending
+                }
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    result = future.result()
+                    result['cached'] = False
+                    all_results[index] = result
+                    
+                    # Failures aren't cached so a transient error is retried
+                    if result['success'] and cache_keys[index] is not None:
+                        result_cache[cache_keys[index]] = result
+                    
+                    done += 1
+                    _print_progress(done, len(pdf_csv_pairs), result, "Tested")
     
     # Comprehensive analysis
     total_time = time.time() - start_time
@@ -391,29 +597,33 @@ def main():
     print("DETAILED RESULTS")
     print("="*80)
     
+    # Build the whole section and print it once rather than line by line
+    lines = []
     for result in all_results:
         status = "✅ PASS" if result['success'] else "❌ FAIL"
         expected_count = result['expected']['total_fields'] if result['expected'] else 0
+        tests = result['tests']
         
-        print(f"\n{status} {result['name']}:")
-        print(f"  Expected: {expected_count} fields")
+        lines.append(f"\n{status} {result['name']}:")
+        lines.append(f"  Expected: {expected_count} fields")
         
-        if result['tests']['pypdfform_basic']['success']:
-            detected = result['tests']['pypdfform_basic']['data']['total_fields']
-            print(f"  PyPDFForm: {detected} fields")
+        if tests['pypdfform_basic']['success']:
+            lines.append(f"  PyPDFForm: {tests['pypdfform_basic']['data']['total_fields']} fields")
         else:
-            print(f"  PyPDFForm: FAILED - {result['tests']['pypdfform_basic']['data'].get('error', 'Unknown')}")
+            lines.append(f"  PyPDFForm: FAILED - {tests['pypdfform_basic']['data'].get('error', 'Unknown')}")
         
-        if result['tests']['pypdfform_wrapper']['success']:
-            detected = result['tests']['pypdfform_wrapper']['data']['total_fields']
-            print(f"  Wrapper: {detected} fields")
+        if tests['pypdfform_wrapper']['success']:
+            lines.append(f"  Wrapper: {tests['pypdfform_wrapper']['data']['total_fields']} fields")
         else:
-            print(f"  Wrapper: FAILED - {result['tests']['pypdfform_wrapper']['data'].get('error', 'Unknown')}")
+            lines.append(f"  Wrapper: FAILED - {tests['pypdfform_wrapper']['data'].get('error', 'Unknown')}")
         
-        renaming_status = "✅" if result['tests']['field_renaming']['success'] else "❌"
-        print(f"  Renaming: {renaming_status}")
+        renaming_status = "✅" if tests['field_renaming']['success'] else "❌"
+        lines.append(f"  Renaming: {renaming_status}")
         
-        print(f"  Time: {result['performance']['processing_time']:.2f}s")
+        cached_note = " (cached from an earlier run)" if result.get('cached') else ""
+        lines.append(f"  Time: {result['performance']['processing_time']:.2f}s{cached_note}")
+    
+    print("\n".join(lines))
     
     # Final summary
     print_comprehensive_summary(analysis)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit tests for field_cache
+
+Entries are keyed on the PDF's size, mtime and header hash, so any edit to
+the file must miss the cache instead of returning stale field metadata.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ARCHIVE_DIR = Path(__file__).parent.parent.parent
+if str(ARCHIVE_DIR) not in sys.path:
+    sys.path.insert(0, str(ARCHIVE_DIR))
+
+from field_cache import HEADER_BYTES, FieldCache, cache_key
+
+PAYLOAD = {"fields": [{"name": "first_name", "type": "TextField"}]}
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "form.pdf"
+    path.write_bytes(b"%PDF-1.7\n" + b"x" * (2 * HEADER_BYTES))
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FieldCache(tmp_path / "cache")
+
+
+def test_cache_key_fields(pdf):
+    size, mtime_ns, digest = cache_key(str(pdf))
+    st = os.stat(pdf)
+    assert (size, mtime_ns) == (st.st_size, st.st_mtime_ns)
+    assert isinstance(digest, str) and digest
+
+
+def test_cache_key_stable(pdf):
+    assert cache_key(str(pdf)) == cache_key(str(pdf))
+
+
+def test_cache_key_hashes_header_only(pdf, tmp_path):
+    other = tmp_path / "other.pdf"
+    other.write_bytes(pdf.read_bytes()[:HEADER_BYTES] + b"y" * HEADER_BYTES)
+    changed = tmp_path / "changed.pdf"
+    changed.write_bytes(b"%PDF-1.4\n" + pdf.read_bytes()[9:])
+
+    assert cache_key(str(other))[2] == cache_key(str(pdf))[2]
+    assert cache_key(str(changed))[2] != cache_key(str(pdf))[2]
+
+
+def test_cache_key_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        cache_key(str(tmp_path / "missing.pdf"))
+
+
+def test_round_trip(cache, pdf):
+    assert cache.get(str(pdf)) is None
+    assert cache.put(str(pdf), PAYLOAD)
+    assert cache.get(str(pdf)) == PAYLOAD
+
+
+def test_stale_after_mtime_change(cache, pdf):
+    cache.put(str(pdf), PAYLOAD)
+    st = os.stat(pdf)
+    os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cache.get(str(pdf)) is None
+
+
+def test_stale_after_size_change(cache, pdf):
+    cache.put(str(pdf), PAYLOAD)
+    st = os.stat(pdf)
+    with open(pdf, "ab") as f:
+        f.write(b"%%EOF\n")
+    # Restore the mtime so only the size differs
+    os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert cache.get(str(pdf)) is None
+
+
+def test_missing_pdf_is_a_miss(cache, tmp_path):
+    assert cache.get(str(tmp_path / "missing.pdf")) is None
+
+
+def test_corrupt_entry_is_a_miss(cache, pdf):
+    cache.put(str(pdf), PAYLOAD)
+    cache._entry_path(str(pdf)).write_text("{not json")
+    assert cache.get(str(pdf)) is None
+
+
+def test_put_unserializable_payload(cache, pdf):
+    assert not cache.put(str(pdf), {("not", "a", "str", "key"): []})
+    assert cache.get(str(pdf)) is None
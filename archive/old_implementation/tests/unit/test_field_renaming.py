@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for PyPDFFormFieldRenamer.rename_fields
+
+Mappings apply all at once, so chained and swapped renames must move each
+widget to its new name and report success.
+"""
+
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyPDFForm")
+from pypdf import PdfReader
+
+ARCHIVE_DIR = Path(__file__).parent.parent.parent
+if str(ARCHIVE_DIR) not in sys.path:
+    sys.path.insert(0, str(ARCHIVE_DIR))
+
+from pypdfform_field_renamer import PyPDFFormFieldRenamer
+
+PDF_PATH = ARCHIVE_DIR / "training_data/pdf_csv_pairs/W-4R_parsed.pdf"
+
+
+def _widget_rects(pdf_bytes):
+    """Map each field name to the /Rect of its first widget annotation."""
+    rects = {}
+    for page in PdfReader(BytesIO(pdf_bytes)).pages:
+        for annot in page.get('/Annots', []):
+            annot = annot.get_object()
+            if '/T' in annot:
+                rects.setdefault(annot['/T'], tuple(float(x) for x in annot['/Rect']))
+    return rects
+
+
+@pytest.fixture
+def renamer():
+    if not PDF_PATH.exists():
+        pytest.skip(f"PDF not found: {PDF_PATH}")
+    renamer = PyPDFFormFieldRenamer(str(PDF_PATH))
+    assert renamer.load_pdf()
+    return renamer
+
+
+def _assert_renamed(renamer, mappings):
+    before = _widget_rects(renamer.wrapper.read())
+    results = renamer.rename_fields(mappings)
+    after = _widget_rects(renamer.wrapper.read())
+
+    assert [(r.success, r.error) for r in results] == [(True, None)] * len(mappings)
+    assert len(after) == len(before)
+    for old_name, new_name in mappings.items():
+        assert after[new_name] == before[old_name]
+
+
+def test_chained_rename(renamer):
+    a, _, c = list(renamer.wrapper.widgets)[:3]
+    _assert_renamed(renamer, {a: "chained_target", c: a})
+
+
+def test_swapped_rename(renamer):
+    a, b = list(renamer.wrapper.widgets)[:2]
+    _assert_renamed(renamer, {a: b, b: a})
+
+
+def test_rotated_rename(renamer):
+    a, b, c = list(renamer.wrapper.widgets)[:3]
+    _assert_renamed(renamer, {a: b, b: c, c: a})
+
+
+def test_unknown_source_fails(renamer):
+    results = renamer.rename_fields({"no_such_field": "anything"})
+    assert not results[0].success
+    assert results[0].error == "Field not found: no_such_field"
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for mcp_server_backup's mapping checks
+
+These run before any PDF is loaded (the preview fast path answers from the
+field cache), so they are tested without PyPDFForm.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mcp")
+
+ARCHIVE_DIR = Path(__file__).parent.parent.parent
+if str(ARCHIVE_DIR) not in sys.path:
+    sys.path.insert(0, str(ARCHIVE_DIR))
+
+import mcp_server_backup as server
+from field_cache import FieldCache
+
+
+@pytest.mark.parametrize("mapping", [{}, None, [("a", "b")], "a=b"])
+def test_cheap_validate_rejects_missing_mapping(mapping):
+    assert server._cheap_validate(mapping) == ["No field mappings provided"]
+
+
+def test_cheap_validate_accepts_valid_mapping():
+    assert server._cheap_validate({"Text1": "owner_name", "Text2": "owner-ssn"}) == []
+
+
+def test_cheap_validate_duplicate_targets():
+    errors = server._cheap_validate({"Text1": "name", "Text2": "name"})
+    assert errors == ["Duplicate target names in field mappings"]
+
+
+@pytest.mark.parametrize("bad_name", ["", "owner name", "a/b", "a(1)", "50%", None, 7])
+def test_cheap_validate_invalid_target(bad_name):
+    errors = server._cheap_validate({"Text1": "owner_name", "Text2": bad_name})
+    assert len(errors) == 1
+    assert errors[0].startswith("Invalid target names")
+    assert repr(bad_name) in errors[0]
+
+
+def test_cheap_validate_reports_both_problems():
+    errors = server._cheap_validate({"Text1": "a b", "Text2": "a b"})
+    assert errors[0] == "Duplicate target names in field mappings"
+    assert errors[1].startswith("Invalid target names")
+
+
+@pytest.fixture
+def cached_pdf(tmp_path, monkeypatch):
+    """A PDF whose fields are already in the field cache; loading it is recorded."""
+    pdf = tmp_path / "form.pdf"
+    pdf.write_bytes(b"%PDF-1.7\n")
+    cache = FieldCache(tmp_path / "cache")
+    cache.put(str(pdf), {"fields": [{"name": "Text1"}, {"name": "Text2"}]})
+
+    loads = []
+    def fake_load(pdf_path, progress_callback=None):
+        loads.append(pdf_path)
+        return None
+
+    monkeypatch.setattr(server, "field_cache", cache)
+    monkeypatch.setattr(server, "_pdf_libraries_available", lambda: True)
+    monkeypatch.setattr(server, "_load_renamer", fake_load)
+    return str(pdf), loads
+
+
+def test_preview_answered_from_cache(cached_pdf):
+    pdf, loads = cached_pdf
+    result = server._do_rename(pdf, {"Text1": "owner_name", "Text2": "Text2"}, "", True, False)
+
+    assert loads == []
+    assert result["status"] == "validation_success"
+    assert result["field_count"] == 2
+    assert result["validation_results"] == {
+        "errors": [],
+        "warnings": ["Field maps to itself (no change needed): Text2"]
+    }
+
+
+def test_preview_unknown_source_loads_pdf(cached_pdf):
+    pdf, loads = cached_pdf
+    result = server._do_rename(pdf, {"Missing": "owner_name"}, "", True, False)
+
+    assert loads == [pdf]
+    assert result["status"] == "error"
+
+
+def test_rename_always_loads_pdf(cached_pdf):
+    pdf, loads = cached_pdf
+    server._do_rename(pdf, {"Text1": "owner_name"}, "", False, False)
+
+    assert loads == [pdf]
+
+
+def test_preview_without_cache_loads_pdf(cached_pdf, tmp_path, monkeypatch):
+    pdf, loads = cached_pdf
+    monkeypatch.setattr(server, "field_cache", FieldCache(tmp_path / "empty"))
+    server._do_rename(pdf, {"Text1": "owner_name"}, "", True, False)
+
+    assert loads == [pdf]
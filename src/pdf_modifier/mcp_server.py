@@ -374,7 +374,8 @@ async def modify_pdf_fields_v2(
         success_rate = (successful / total * 100) if total > 0 else 0
         
         if not output_path:
-            output_path = pdf_path.replace('.pdf', '_renamed.pdf')
+            base, ext = os.path.splitext(pdf_path)
+            output_path = base + '_renamed' + ext
         
         if renamer.save_pdf(output_path):
             result = {
@@ -443,7 +444,7 @@ async def extract_pdf_fields_enhanced(pdf_path: str) -> List[TextContent]:
                 "timestamp": datetime.now().isoformat()
             }, indent=2))]
         
-        fields = renamer.extract_fields()
+        fields = [field.as_dict() for field in renamer.extract_fields()]
         
         result = {
             "status": "success",